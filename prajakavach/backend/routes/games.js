@@ -1,28 +1,73 @@
 const express = require('express');
-const router = express.Router();
+const fs = require('fs');
+const net = require('net');
 const path = require('path');
-const { spawn } = require('child_process');
+const router = express.Router();
 
-router.post('/:game', (req, res) => {
-  const game = req.params.game;
-  const scriptPath = path.join(__dirname, '../../public/ursina', `${game}.py`);
-  console.log(`Starting game: ${game}, script: ${scriptPath}`);
+// Games are started by the Python launcher daemon (public/ursina/launcher.py),
+// which keeps a bounded pool of warm interpreters with Ursina already imported.
+// Every scenario definition in public/ursina/scenarios is a game.
+const SCENARIO_DIR = path.join(__dirname, '..', '..', 'public', 'ursina', 'scenarios');
+const GAMES = fs.readdirSync(SCENARIO_DIR)
+  .filter((file) => file.endsWith('.json') && file !== 'schema.json')
+  .map((file) => path.basename(file, '.json'));
+const LAUNCHER_HOST = process.env.LAUNCHER_HOST || '127.0.0.1';
+const LAUNCHER_PORT = Number(process.env.LAUNCHER_PORT) || 8765;
+const LAUNCHER_TIMEOUT_MS = 15000;
 
-  try {
-    // Spawn the Python process
-    const pythonProcess = spawn('python', [scriptPath], {
-      detached: true,
-      stdio: 'ignore'
+// Send one JSON line to the launcher and resolve with its one-line JSON reply
+function askLauncher(message) {
+  return new Promise((resolve, reject) => {
+    const socket = net.createConnection({ host: LAUNCHER_HOST, port: LAUNCHER_PORT });
+    let buffer = '';
+    socket.setTimeout(LAUNCHER_TIMEOUT_MS);
+    socket.on('connect', () => socket.write(JSON.stringify(message) + '\n'));
+    socket.on('data', (chunk) => {
+      buffer += chunk;
+      const newline = buffer.indexOf('\n');
+      if (newline !== -1) {
+        socket.end();
+        try {
+          resolve(JSON.parse(buffer.slice(0, newline)));
+        } catch (error) {
+          reject(error);
+        }
+      }
     });
+    socket.on('timeout', () => socket.destroy(new Error('Launcher timed out')));
+    socket.on('error', reject);
+  });
+}
 
-    // Detach the process so it runs independently
-    pythonProcess.unref();
+router.get('/stats', async (req, res) => {
+  try {
+    const reply = await askLauncher({ cmd: 'stats' });
+    res.json(reply.stats);
+  } catch (error) {
+    console.error('Error reading launcher stats:', error);
+    res.status(503).json({ error: 'Game launcher is not running' });
+  }
+});
+
+router.post('/:game', async (req, res) => {
+  const game = req.params.game;
+  if (!GAMES.includes(game)) {
+    return res.status(400).json({ error: `Unknown game: ${game}` });
+  }
+  console.log(`Starting game: ${game}`);
+
+  try {
+    const reply = await askLauncher({ cmd: 'launch', scenario: game });
+    if (!reply.ok) {
+      const status = reply.busy ? 503 : 500;
+      return res.status(status).json({ error: reply.error });
+    }
 
-    console.log(`Game ${game} process spawned`);
-    res.json({ status: `${game} simulation started` });
+    console.log(`Game ${game} started in worker ${reply.pid} (${reply.latency_ms} ms)`);
+    res.json({ status: `${game} simulation started`, latencyMs: reply.latency_ms });
   } catch (error) {
     console.error('Error starting game:', error);
-    res.status(500).json({ error: 'Failed to start game' });
+    res.status(503).json({ error: 'Game launcher is not running' });
   }
 });
 
@@ -0,0 +1,159 @@
+import time as _time
+
+# Taken before the other imports so startup_s includes loading them
+_PROCESS_START = _time.perf_counter()
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+
+from simulation.definitions import scenario_ids  # noqa: E402
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(HERE, 'benchmarks')
+SCENARIOS = tuple(scenario_ids())  # every definition in scenarios/
+METRICS = ('mean_ms', 'p95_ms', 'max_ms', 'startup_s', 'peak_rss_mb')
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 2 ** 20
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss / 2 ** 20 if sys.platform == 'darwin' else rss / 2 ** 10
+
+
+# --- Child process: run one scenario offscreen ---
+def run_scenario(name, frames, warmup, size):
+    from panda3d.core import loadPrcFileData
+    loadPrcFileData('', 'window-type offscreen')
+    loadPrcFileData('', f'win-size {size[0]} {size[1]}')
+    loadPrcFileData('', 'sync-video false')
+
+    from direct.showbase import ShowBaseGlobal
+    from ursina import Ursina, held_keys
+    from engine.scenes import SceneManager
+    from main_menu import DRILL_SCENES
+
+    app = Ursina()
+    manager = SceneManager({name: DRILL_SCENES[name]}, home=name)
+    scene = manager.current
+    task_mgr = ShowBaseGlobal.base.taskMgr
+
+    task_mgr.step()
+    startup = _time.perf_counter() - _PROCESS_START
+
+    # Scripted input: pace left and right so the drill keeps running
+    times = []
+    for frame in range(frames + warmup):
+        key = 'd' if (frame // 45) % 2 else 'a'
+        held_keys['a'] = key == 'a'
+        held_keys['d'] = key == 'd'
+        if getattr(scene, 'state', None) is not None and scene.state.outcome is not None:
+            scene.restart()
+        start = _time.perf_counter()
+        task_mgr.step()
+        if frame >= warmup:
+            times.append((_time.perf_counter() - start) * 1000)
+
+    times.sort()
+    return {
+        'frames': frames,
+        'mean_ms': statistics.mean(times),
+        'p95_ms': times[min(len(times) - 1, len(times) * 95 // 100)],
+        'max_ms': times[-1],
+        'startup_s': startup,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+# --- Parent process: one child per scenario, then compare ---
+def measure(name, args):
+    cmd = [sys.executable, os.path.abspath(__file__), '--child', name,
+           '--frames', str(args.frames), '--warmup', str(args.warmup),
+           '--size', str(args.size[0]), str(args.size[1])]
+    out = subprocess.run(cmd, cwd=HERE, capture_output=True, text=True)
+    if out.returncode != 0:
+        return {'error': out.stderr.strip().splitlines()[-1] if out.stderr.strip() else 'failed'}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+    for name, result in report['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if not base or 'error' in result or 'error' in base:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if old and new is not None:
+                change = (new - old) / old
+                result.setdefault('change', {})[metric] = round(change, 4)
+                if change > tolerance:
+                    regressions.append(f'{name} {metric}: {old:.2f} -> {new:.2f} (+{change:.0%})')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Frame-budget benchmark for the drill scenarios.')
+    parser.add_argument('scenarios', nargs='*', default=list(SCENARIOS))
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--warmup', type=int, default=60)
+    parser.add_argument('--size', type=int, nargs=2, default=(1280, 720))
+    parser.add_argument('--tolerance', type=float, default=0.15, help='allowed slowdown before failing')
+    parser.add_argument('--report', default=os.path.join(BENCH_DIR, 'report.json'))
+    parser.add_argument('--baseline', default=os.path.join(BENCH_DIR, 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.frames, args.warmup, args.size)))
+        return 0
+
+    report = {'python': sys.version.split()[0], 'platform': sys.platform,
+              'frames': args.frames, 'scenarios': {}}
+    for name in args.scenarios:
+        result = report['scenarios'][name] = measure(name, args)
+        if 'error' in result:
+            print(f"{name}: {result['error']}")
+        else:
+            print(f"{name}: mean {result['mean_ms']:.2f} ms, p95 {result['p95_ms']:.2f} ms, "
+                  f"max {result['max_ms']:.2f} ms, startup {result['startup_s']:.2f} s, "
+                  f"peak RSS {result['peak_rss_mb'] or 0:.0f} MB")
+
+    regressions = []
+    failed = any('error' in r for r in report['scenarios'].values())
+    # Frame times only compare on the same machine, so the first clean run on
+    # a machine becomes its baseline and every later run is checked against it
+    save_baseline = args.save_baseline or (not os.path.exists(args.baseline) and not failed)
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+    report['regressions'] = regressions
+
+    os.makedirs(os.path.dirname(args.report), exist_ok=True)
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2)
+    if save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Baseline saved to {args.baseline}')
+
+    for line in regressions:
+        print(f'REGRESSION {line}')
+    return 1 if regressions or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
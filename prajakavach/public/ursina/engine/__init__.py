@@ -0,0 +1 @@
+# Shared systems used by the drill scenarios.
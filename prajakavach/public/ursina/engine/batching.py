@@ -0,0 +1,54 @@
+from panda3d.core import TextureStage
+from ursina import Entity, color, load_model, load_texture
+
+
+class StaticBatch(Entity):
+    # Scenery that never moves. Props are added as plain model copies (no
+    # Entity each) and flattened into a few Geoms, grouped by texture, when
+    # build() is called, so a hundred buildings cost about one draw call.
+    # Props are merged per chunk of the ground rather than all together, so
+    # each chunk keeps its own bounds and Panda3D's view-frustum culling can
+    # skip the ones off screen.
+    def __init__(self, chunk_size=25.0, **kwargs):
+        super().__init__(**kwargs)
+        self.geometry = self.attach_new_node('static-geometry')
+        self.chunk_size = chunk_size
+        self.chunks = {}
+        self.colliders = []
+        self.count = 0
+        self.built = False
+
+    def _chunk(self, position):
+        key = (int(position[0] // self.chunk_size), int(position[2] // self.chunk_size))
+        if key not in self.chunks:
+            self.chunks[key] = self.geometry.attach_new_node(f'chunk-{key[0]}-{key[1]}')
+        return self.chunks[key]
+
+    def add(self, model='cube', position=(0, 0, 0), scale=1, rotation=(0, 0, 0), color=color.white,
+            texture=None, texture_scale=None, collider=None):
+        if isinstance(scale, (int, float)):
+            scale = (scale, scale, scale)
+        prop = self._chunk(position).attach_new_node('prop')
+        prop.set_pos(*position)
+        prop.set_scale(*scale)
+        # Same axis mapping as Entity.rotation
+        prop.set_hpr(-rotation[1], -rotation[0], rotation[2])
+        load_model(model).copy_to(prop)
+        prop.set_color(color)
+        if texture:
+            prop.set_texture(load_texture(texture)._texture, 1)
+            if texture_scale:
+                prop.set_tex_scale(TextureStage.get_default(), *texture_scale)
+        if collider:
+            # Keep collision as an invisible Entity; only the visuals are merged
+            self.colliders.append(Entity(parent=self, model=model, position=position, scale=scale,
+                                         rotation=rotation, collider=collider, visible=False))
+        self.count += 1
+        return prop
+
+    def build(self):
+        # Bakes transforms, colours and texture matrices into the vertices of each chunk
+        for chunk in self.chunks.values():
+            chunk.flatten_strong()
+        self.built = True
+        return self
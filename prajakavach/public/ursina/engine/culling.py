@@ -0,0 +1,66 @@
+import numpy as np
+from ursina import application, window
+
+# Cheaper stand-ins for props that cover only a few pixels on screen
+LOD_MODELS = {'sphere': 'icosphere'}
+LOD_PIXELS = 24  # below this projected size a prop uses its LOD model
+
+
+class ViewCuller:
+    # Runs many world points through the camera's model-view-projection at once,
+    # so effects can tell which of their pieces are on screen without a Panda3D
+    # call per piece. update() once per frame, then query with NumPy arrays.
+    def __init__(self, margin=0.1):
+        self.margin = margin  # in normalised screen units, so pieces slide in already updated
+        self.matrix = np.eye(4, dtype=np.float32)
+        self.pixel_scale = 1.0
+
+    def update(self, root):
+        # root: the node the points are expressed in (a scene's world root)
+        cam = application.base.cam
+        m = root.get_mat(cam) * cam.node().get_lens().get_projection_mat()
+        self.matrix[...] = [[m.get_cell(r, c) for c in range(4)] for r in range(4)]
+        # World units to pixels for a unit-size object (divided by w per point)
+        self.pixel_scale = float(np.linalg.norm(self.matrix[:3, 1])) * window.size[1] / 2
+
+    def _clip(self, points):
+        return points @ self.matrix[:3] + self.matrix[3]
+
+    def visible(self, points, radius=0.0):
+        h = self._clip(np.asarray(points, dtype=np.float32))
+        w = h[:, 3]
+        limit = (1.0 + self.margin) * w + radius * self.pixel_scale / (window.size[1] / 2)
+        return (w > 0) & (np.abs(h[:, 0]) <= limit) & (np.abs(h[:, 1]) <= limit)
+
+    def pixel_size(self, points, sizes):
+        w = self._clip(np.asarray(points, dtype=np.float32))[:, 3]
+        return np.asarray(sizes) * self.pixel_scale / np.maximum(w, 1e-6)
+
+
+class CulledGroup:
+    # Entities with their positions mirrored in an array. Each frame update()
+    # hides what left the screen, shows what came back, swaps models for their
+    # LOD stand-in when they get small on screen, and returns the indices of
+    # the visible ones so the caller only animates those.
+    def __init__(self, entities, positions, sizes, model='sphere'):
+        self.entities = list(entities)
+        self.positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        self.sizes = np.asarray(sizes, dtype=np.float32)
+        self.model = model
+        self.lod_model = LOD_MODELS.get(model)
+        n = len(self.entities)
+        self.shown = np.ones(n, dtype=bool)
+        self.low = np.zeros(n, dtype=bool)
+
+    def update(self, culler):
+        visible = culler.visible(self.positions, self.sizes.max(initial=0.0))
+        for i in np.nonzero(visible != self.shown)[0].tolist():
+            self.entities[i].visible = bool(visible[i])
+        self.shown = visible
+        if self.lod_model is not None:
+            low = culler.pixel_size(self.positions, self.sizes) < LOD_PIXELS
+            # Only visible entities swap; hidden ones catch up when they reappear
+            for i in np.nonzero((low != self.low) & visible)[0].tolist():
+                self.entities[i].model = self.lod_model if low[i] else self.model
+                self.low[i] = low[i]
+        return np.nonzero(visible)[0]
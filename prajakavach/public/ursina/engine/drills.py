@@ -0,0 +1,573 @@
+from functools import partial
+
+import numpy as np
+from ursina import Button, Entity, Text, color, held_keys, time
+
+from engine import telemetry
+from engine.batching import StaticBatch
+from engine.culling import CulledGroup, ViewCuller
+from engine.heat import HeatParticles, HeatShimmer
+from engine.hud import HudLabel
+from engine.particles import CrowdMesh, DebrisField
+from engine.pool import EntityPool
+from engine.scenes import DrillScene, run_standalone
+from engine.scheduler import Scheduler
+from engine.water import WaterSurface
+from simulation import SCENARIOS, crowd, definitions
+from simulation.common import HEAD_OFFSET, Inputs, distance
+from simulation.seismic import SeismicShake
+
+HUD_INTERVAL = 0.1  # seconds of simulation time between HUD refreshes
+REPLAN_SWEEPS = 16  # flow field sweeps per crowd tick, so a big re-plan is spread over a few ticks
+
+
+def make_color(value, default=color.white):
+    # Definitions name an Ursina colour ('azure') or give rgb / rgba values
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return getattr(color, value)
+    return color.rgb(*value) if len(value) == 3 else color.rgba(*value)
+
+
+# --- Effects: the visual systems a definition can switch on ---
+class Effect:
+    phase = 'effects'
+    settles = False  # keeps updating after the outcome until its last pieces are gone
+
+    def __init__(self, scene, spec):
+        self.scene = scene
+        self.spec = spec
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def restart(self, state):
+        pass
+
+    def update(self, state):
+        pass
+
+
+class WaterEffect(Effect):
+    # Heightfield following the flood solver
+    phase = 'water'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.surface = WaterSurface(scene.state.flood, parent=scene.world, color=make_color(spec.get('color'), color.blue))
+
+    def restart(self, state):
+        self.surface.set_flood(state.flood)
+
+    def update(self, state):
+        self.surface.sync()
+
+
+class FloatingDebrisEffect(Effect):
+    # Debris floating on the local water depth
+    phase = 'debris'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.pieces = []
+        for x, y, z, size, speed in scene.layout[spec['group']].tolist():
+            d = Entity(
+                parent=scene.world,
+                model='sphere',
+                scale=size,
+                color=make_color(spec.get('color'), color.gray),
+                position=(x, y, z)
+            )
+            self.pieces.append(d)
+        points = scene.layout[spec['group']]
+        self.group = CulledGroup(self.pieces, points[:, :3], points[:, 3])
+
+    def restart(self, state):
+        points = self.scene.layout[self.spec['group']]
+        self.group.positions[:] = points[:, :3]
+        for d, (x, y, z) in zip(self.pieces, points[:, :3].tolist()):
+            d.position = (x, y, z)
+
+    def update(self, state):
+        flood = state.flood
+        rng = self.scene.rng
+        positions = self.group.positions
+        for i in self.group.update(self.scene.culler).tolist():
+            d = self.pieces[i]
+            depth = flood.depth_at(d.x, d.z)
+            if d.y < depth:
+                d.y = positions[i, 1] = depth + rng.uniform(0, 0.1)
+
+
+class FallingDebrisEffect(Effect):
+    # One array-backed mesh instead of one Entity per piece of debris
+    phase = 'debris'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.field = DebrisField(
+            parent=scene.world,
+            points=scene.layout[spec['group']],
+            floor=spec.get('floor', 0.1),
+            seed=scene.seed,
+            color=make_color(spec.get('color'), color.gray),
+        )
+        # Without a debris hazard the field falls on its own, once per simulation step
+        self.ticks = scene.clock.group('debris', scene.clock.dt)
+        self.shown = np.zeros(self.field.count, dtype=bool)
+
+    def restart(self, state):
+        self.field.reset()
+        self.shown[:] = True
+
+    def update(self, state):
+        # Every piece moves, but only on-screen ones are redrawn: those in view
+        # now or last frame after a move, and those just scrolled into view.
+        # With a debris hazard the simulation owns the bodies, and settled
+        # debris is not redrawn at all.
+        field = self.field
+        debris = state.debris
+        if debris is None:
+            for _ in range(self.ticks.ticks):
+                field.step(self.ticks.dt)
+            moved = self.ticks.ticks > 0
+        else:
+            moved = debris.moved
+            if moved:
+                field.positions[:] = debris.pos
+                debris.moved = False
+        visible = self.scene.culler.visible(field.positions, 0.2)
+        rows = np.nonzero((visible | self.shown) if moved else (visible & ~self.shown))[0]
+        self.shown = visible
+        if len(rows):
+            field.sync(rows)
+
+
+class HeatParticlesEffect(Effect):
+    # Heat rising off the ground, animated entirely in a vertex shader (engine.heat)
+    phase = 'particles'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.particles = HeatParticles(
+            scene.layout[spec['group']],
+            bottom=spec.get('bottom', 1),
+            top=spec.get('top', 5),
+            tint=make_color(spec.get('color'), color.yellow),
+            alpha=spec.get('alpha', 0.6),
+            parent=scene.world,
+        )
+
+
+class ShimmerEffect(Effect):
+    # Heat haze over the whole view, a camera post-process while the drill is shown
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.shimmer = HeatShimmer(
+            strength=spec.get('strength', 0.003),
+            horizon=spec.get('horizon', 0.6),
+            tint=make_color(spec.get('color'), color.orange),
+            warmth=spec.get('warmth', 0.12),
+        )
+
+    def enter(self):
+        self.shimmer.enable()
+
+    def exit(self):
+        self.shimmer.disable()
+
+
+class ShakeEffect(Effect):
+    # Earthquake ground motion (simulation.seismic) applied to the world root
+    phase = 'shake'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.motion = SeismicShake(
+            magnitude=spec.get('magnitude', 6.5),
+            distance=spec.get('distance', 10.0),
+            seed=scene.seed,
+            amplitude=spec.get('amplitude', 0.05),
+            rotation=spec.get('rotation', 2.0),
+        )
+
+    def restart(self, state):
+        self.update(state)
+
+    def update(self, state):
+        # Simulation time, so a replay shakes exactly like the attempt did
+        dx, dy, rotation = self.motion.at(self.scene.render_time)
+        # Panda3D order: x, y, z, then heading, pitch, roll (Ursina's rotation_z)
+        self.scene.world.set_pos_hpr(float(dx), float(dy), 0, 0, 0, float(rotation))
+
+
+class FrontEffect(Effect):
+    # Wall whose leading edge follows state.front_x
+    phase = 'hazard'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.height = spec.get('height', 3)
+        self.wall = Entity(
+            parent=scene.world,
+            model='cube',
+            scale=(100, self.height, 20),
+            color=make_color(spec.get('color'), color.brown),
+            position=(-100, self.height / 2, 0)
+        )
+
+    def restart(self, state):
+        self.update(state)
+
+    def update(self, state):
+        self.wall.x = state.front_x - 50
+
+
+class BurstEffect(Effect):
+    # Short-lived spheres thrown out from the player when an event fires
+    # (a pickup collected, the goal reached), recycled through a pool
+    phase = 'particles'
+    settles = True
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.event = spec['event']
+        self.count = spec.get('count', 8)
+        self.life = spec.get('life', 0.6)
+        self.speed = spec.get('speed', 3.0)
+        self.pool = EntityPool(
+            self.count * spec.get('bursts', 3),
+            parent=scene.world,
+            model='sphere',
+            scale=0.15,
+            color=make_color(spec.get('color'), color.white),
+        )
+
+    def restart(self, state):
+        self.pool.release_all()
+
+    def update(self, state):
+        if self.event in state.events:
+            player = state.player
+            rng = self.scene.rng
+            for _ in range(self.count):
+                p = self.pool.acquire(position=(player.x, player.y, 0), life=self.life)
+                if p is None:
+                    break
+                p.velocity = (rng.uniform(-1, 1) * self.speed, rng.uniform(0.5, 1.5) * self.speed)
+        dt = time.dt
+        for p in self.pool.active:
+            vx, vy = p.velocity
+            p.x += vx * dt
+            p.y += vy * dt
+            p.velocity = (vx, vy - 9.8 * dt)
+        self.pool.expire(dt)
+
+
+class CrowdEffect(Effect):
+    # Other students evacuating on their own, slower tick of the scene clock,
+    # drawn as one mesh between their last two positions
+    phase = 'crowd'
+
+    def __init__(self, scene, spec):
+        super().__init__(scene, spec)
+        self.ticks = scene.clock.group('crowd', spec.get('dt', 0.05))
+        self.replan_every = spec.get('replan', 1.0)
+        self.mesh = CrowdMesh(scene.definition['crowd']['agents'], parent=scene.world,
+                              color=make_color(spec.get('color'), color.orange))
+        self.restart(None)
+
+    def restart(self, state):
+        self.crowd = crowd.from_definition(self.scene.definition, self.scene.seed)
+        self.previous = self.crowd.positions.copy()
+        self.drawn = np.empty_like(self.previous)
+        self.next_plan = 0.0
+        self.reported = False
+        self.sync(1.0)
+
+    def sync(self, alpha):
+        c = self.crowd
+        np.subtract(c.positions, self.previous, out=self.drawn)
+        self.drawn *= alpha
+        self.drawn += self.previous
+        self.mesh.sync(self.drawn, np.isnan(c.exit_time))
+
+    def update(self, state):
+        c = self.crowd
+        for _ in range(self.ticks.ticks):
+            if c.time >= self.next_plan:
+                # Route around flood water that has become too deep to wade through
+                c.replan(state.flood, REPLAN_SWEEPS)
+                self.next_plan += self.replan_every
+            else:
+                c.settle(REPLAN_SWEEPS)
+            self.previous[:] = c.positions
+            c.step(self.ticks.dt)
+        self.sync(self.ticks.alpha)
+        if not c.remaining and not self.reported:
+            # The whole crowd is out; logged with the attempt for the telemetry summary
+            self.reported = True
+            self.scene.telemetry.emit(telemetry.EVACUATED, value=float(c.exit_time.max()))
+
+
+EFFECTS = {
+    'water': WaterEffect,
+    'floating_debris': FloatingDebrisEffect,
+    'falling_debris': FallingDebrisEffect,
+    'heat_particles': HeatParticlesEffect,
+    'shimmer': ShimmerEffect,
+    'shake': ShakeEffect,
+    'front': FrontEffect,
+    'burst': BurstEffect,
+    'crowd': CrowdEffect,
+}
+
+
+class ScenarioScene(DrillScene):
+    # Every drill: a definition from scenarios/ played by simulation.scenario
+    def __init__(self, definition, manager=None, seed=None, playback=None):
+        self.definition = definition
+        self.scenario = definition['name']
+        self.title = definition['title']
+        if 'ambient' in definition:
+            self.ambient_color = make_color(definition['ambient'])
+        self.sim = SCENARIOS[self.scenario]
+        super().__init__(manager, seed, playback)
+
+    def build(self):
+        d = self.definition
+        # Simulation steps, and the slower ticks of the crowd, HUD and telemetry
+        self.clock = Scheduler()
+        self.clock.group('hud', HUD_INTERVAL)
+        self.clock.group('telemetry', self.telemetry.sample_interval)
+        self.state = self.sim.new_state(self.seed)
+        self.previous = (self.state.player.x, self.state.player.y)
+        # Everything in the world hangs off one node, so moving the whole
+        # scene (an earthquake) is one transform however much it holds
+        self.world = Entity(parent=self)
+        self.culler = ViewCuller()
+
+        # --- Static scenery (merged into a few meshes) ---
+        self.scenery = StaticBatch(parent=self.world)
+        self.scenery.add(model='cube', scale=(100, 0.1, 100), texture='white_cube', texture_scale=(100, 100),
+                         color=make_color(d.get('ground', {}).get('color'), color.rgb(100, 150, 100)), collider='box')
+        for s in d.get('structures', []):
+            self.scenery.add(model=s.get('model', 'cube'), scale=tuple(s['scale']), position=tuple(s['position']),
+                             color=make_color(s.get('color')), texture=s.get('texture'))
+        for group in d.get('scenery', []):
+            for x, y, z, size, speed in self.layout[group['group']].tolist():
+                self.scenery.add(
+                    model=group.get('model', 'cube'),
+                    scale=tuple(group['scale']),
+                    color=make_color(group.get('color')),
+                    position=(x, y, z)
+                )
+        self.scenery.build()
+
+        # --- Character ---
+        player = d['player']
+        self.body = Entity(
+            parent=self.world,
+            model='cube',
+            color=make_color(player.get('body_color'), color.azure),
+            scale=(0.5, 1, 0.5),
+            position=(-8, 0.5, 0),
+        )
+        self.head = Entity(
+            parent=self.world,
+            model='sphere',
+            color=make_color(player.get('head_color'), color.cyan),
+            scale=0.4,
+            position=(-8, 1.3, 0)
+        )
+
+        # --- Pickups ---
+        self.pickups = []
+        pickups = d.get('pickups')
+        if pickups is not None:
+            for source, (x, y, z, size, speed) in zip(self.state.pickups, self.layout[pickups['group']].tolist()):
+                self.pickups.append(Entity(
+                    parent=self.world,
+                    model='sphere',
+                    scale=size,
+                    color=make_color(pickups.get('color'), color.blue),
+                    position=(source.x, source.y, source.z)
+                ))
+
+        self.effects = [EFFECTS[spec['type']](self, spec) for spec in d.get('effects', [])]
+
+        # --- Instructions Text ---
+        self.instructions = Text(
+            parent=self.ui,
+            text=d['text']['instructions'],
+            position=(0, 0.35),
+            origin=(0, 0),
+            scale=1.5,
+            background=True,
+            background_color=color.black66
+        )
+
+        # --- Timer ---
+        timer = d['timer']
+        self.timer_text = HudLabel(
+            timer['label'],
+            timer['start'],
+            warn_below=timer.get('warn_below'),
+            parent=self.ui,
+            position=(0, 0.25),
+            origin=(0, 0),
+            scale=2,
+            background=True,
+            background_color=color.black66
+        )
+
+        # --- Pickup Message ---
+        self.pickup_message = Text(
+            parent=self.ui,
+            text="",
+            position=(0, 0.15),
+            origin=(0, 0),
+            scale=1.5,
+            background=True,
+            background_color=color.rgba(0,0,255,0.4)
+        )
+        self.pickup_time = 0
+
+        # --- Restart Button ---
+        self.restart_button = Button(parent=self.ui, text='Restart', position=(0, -0.3), scale=(0.2, 0.1), on_click=self.restart, visible=False)
+
+    def on_enter(self):
+        for effect in self.effects:
+            effect.enter()
+        super().on_enter()
+
+    def on_exit(self):
+        for effect in self.effects:
+            effect.exit()
+
+    def restart(self):
+        # Same seed, so the layout stays where it was
+        self.state = self.sim.new_state(self.seed)
+        self.clock.reset()
+        state = self.state
+        self.previous = (state.player.x, state.player.y)
+        self.body.position = (state.player.x, state.player.y, 0)
+        self.head.position = (state.player.x, state.player.head_y, 0)
+        self.body.visible = True
+        self.head.visible = True
+        self.instructions.text = self.definition['text']['instructions']
+        self.timer_text.show(state.remaining)
+        self.pickup_message.text = ""
+        self.pickup_time = 0
+        self.restart_button.visible = False
+        for entity in self.pickups:
+            entity.visible = True
+        for effect in self.effects:
+            effect.restart(state)
+        self.start_attempt(state)
+
+    @property
+    def render_time(self):
+        # Simulation time of what is drawn this frame, one step behind at most
+        return max(self.state.elapsed - (1.0 - self.clock.alpha) * self.clock.dt, 0.0)
+
+    # --- Update loop ---
+    def update(self):
+        state = self.state
+        profile = self.profiler
+        if state.outcome is None:
+            with profile.phase('input'):
+                inputs = Inputs.from_keys(held_keys)
+            player = state.player
+            with profile.phase('simulation'):
+                for _ in range(self.clock.advance(time.dt)):
+                    self.previous = (player.x, player.y)
+                    self.sim.step(state, self.step_inputs(inputs), self.clock.dt)
+                    if state.outcome is not None:
+                        break  # steps after the result would end up in the recording
+
+            with profile.phase('culling'):
+                self.culler.update(self.world)
+
+            # Draw the player between the last two simulation steps, so motion
+            # stays smooth when the screen refreshes faster than the simulation
+            with profile.phase('transforms'):
+                alpha = self.clock.alpha
+                x0, y0 = self.previous
+                x = x0 + (player.x - x0) * alpha
+                y = y0 + (player.y - y0) * alpha
+                self.body.x = x
+                self.body.y = y
+                self.head.x = x
+                self.head.y = y + HEAD_OFFSET
+
+            for effect in self.effects:
+                with profile.phase(effect.phase):
+                    effect.update(state)
+
+            if self.clock.due('hud') or state.outcome is not None:
+                with profile.phase('hud'):
+                    self.timer_text.show(state.remaining)
+
+            for entity, source in zip(self.pickups, state.pickups):
+                entity.visible = source.active
+
+            for event in state.events:
+                if event == 'hit':
+                    self.telemetry.emit(telemetry.HIT, player.x, player.y, state.injuries)
+                if self.pickups and event == self.definition['pickups']['event']:
+                    self.telemetry.emit(telemetry.PICKUP, player.x, player.y, state.remaining)
+                    self.pickup_time = 3  # Show the pickup message for 3 seconds
+                    self.pickup_message.text = self.definition['pickups'].get('message', '')
+            state.events.clear()
+
+            # Pickup message timer countdown
+            if self.pickup_time > 0:
+                self.pickup_time -= time.dt
+                if self.pickup_time <= 0:
+                    self.pickup_message.text = ""
+
+            if self.clock.due('telemetry'):
+                with profile.phase('telemetry'):
+                    self.telemetry.position(player.x, player.y, distance(player.x, player.y, self.sim.goal_x, self.sim.goal_y))
+
+            if state.outcome is not None:
+                self.finish_attempt(state, state.remaining)
+                self.instructions.text = self.definition['text']['outcomes'][state.outcome]
+                if self.playback is not None:
+                    self.instructions.text += f'\n(replay of an attempt recorded as {self.playback.outcome})'
+                self.body.visible = False
+                self.head.visible = False
+                self.restart_button.visible = True
+
+        else:
+            # A burst raised on the final step (a hit, the goal reached) plays out
+            # instead of freezing on screen
+            for effect in self.effects:
+                if effect.settles:
+                    effect.update(state)
+            # Restart with R key
+            if held_keys['r']:
+                self.restart()
+
+
+# Scene factories for SceneManager, one per definition, in menu order
+DRILL_SCENES = {d['name']: partial(ScenarioScene, d) for d in definitions.load_all()}
+
+
+def run_drill(name):
+    # python floods.py, or python -m engine.drills cyclone
+    run_standalone(DRILL_SCENES[name])
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Play one drill in its own window.')
+    parser.add_argument('scenario', nargs='?', default='floods', choices=sorted(DRILL_SCENES))
+    # engine.profiler reads the flag itself when it is imported; declared here so it is accepted
+    parser.add_argument('--profile', action='store_true', help='show the frame-time overlay')
+    run_drill(parser.parse_args().scenario)
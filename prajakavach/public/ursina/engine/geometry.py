@@ -0,0 +1,45 @@
+import numpy as np
+from panda3d.core import (
+    Geom,
+    GeomNode,
+    GeomTriangles,
+    GeomVertexData,
+    GeomVertexFormat,
+    OmniBoundingVolume,
+)
+
+
+# --- Raw Panda3D geometry helpers ---
+# Ursina's Mesh keeps its vertices in Python lists and rebuilds the whole Geom on
+# every generate(). These helpers build a Geom once and expose its vertex buffer
+# as a NumPy view so callers can rewrite positions in place.
+
+def make_geom_node(name, vertex_count, triangles, dynamic=True, fmt=None):
+    fmt = fmt or GeomVertexFormat.get_v3()
+    usage = Geom.UH_dynamic if dynamic else Geom.UH_static
+    vdata = GeomVertexData(name, fmt, usage)
+    vdata.unclean_set_num_rows(vertex_count)
+
+    prim = GeomTriangles(Geom.UH_static)
+    prim.set_index_type(Geom.NT_uint32)
+    indices = np.ascontiguousarray(triangles, dtype=np.uint32).ravel()
+    handle = prim.modify_vertices()
+    handle.unclean_set_num_rows(len(indices))
+    np.frombuffer(memoryview(handle), dtype=np.uint32)[:] = indices
+
+    geom = Geom(vdata)
+    geom.add_primitive(prim)
+    node = GeomNode(name)
+    node.add_geom(geom)
+    if dynamic:
+        # Vertices move every frame, so skip bounds recomputation and culling.
+        node.set_bounds(OmniBoundingVolume())
+        node.set_final(True)
+    return node
+
+
+def vertex_view(node, columns=3, array=0):
+    # Fetch through modify_* each time so Panda3D knows the buffer needs re-uploading.
+    vdata = node.modify_geom(0).modify_vertex_data()
+    handle = memoryview(vdata.modify_array(array))
+    return np.frombuffer(handle, dtype=np.float32).reshape(-1, columns)
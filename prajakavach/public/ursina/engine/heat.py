@@ -0,0 +1,173 @@
+import numpy as np
+from panda3d.core import (
+    ColorBlendAttrib,
+    Geom,
+    GeomVertexArrayFormat,
+    GeomVertexFormat,
+    InternalName,
+    OmniBoundingVolume,
+    TransparencyAttrib,
+)
+from ursina import Entity, Shader, application, camera, color
+
+from engine.geometry import make_geom_node, vertex_view
+
+# Both shaders animate from Panda3D's osg_FrameTime, so once they are set up
+# Python never touches them again: the heat costs nothing per frame on the CPU.
+
+# --- Screen-space shimmer: the rendered frame resampled through rising ripples ---
+shimmer_shader = Shader(name='heat_shimmer', fragment='''
+#version 140
+
+uniform sampler2D tex;
+uniform float osg_FrameTime;
+uniform float strength;
+uniform float horizon;
+uniform vec4 tint;
+in vec2 uv;
+out vec4 color;
+
+void main() {
+    float t = osg_FrameTime;
+    // Hot air sits on the ground: full strength at the bottom of the screen, none above the horizon
+    float haze = smoothstep(horizon, 0.0, uv.y);
+    // Ripples travel upwards; two frequencies so the pattern does not look like a grating
+    float wave = sin(uv.y * 90.0 - t * 5.0) + 0.5 * sin(uv.y * 157.0 + uv.x * 23.0 - t * 7.3);
+    vec2 offset = vec2(wave, 0.5 * sin(uv.x * 61.0 + t * 3.1)) * strength * haze;
+    vec3 rgb = texture(tex, clamp(uv + offset, 0.0, 1.0)).rgb;
+    color = vec4(mix(rgb, tint.rgb, tint.a * haze), 1.0);
+}
+''', default_input={
+    'strength': 0.003,
+    'horizon': 0.6,
+    'tint': color.rgba(1, 0.65, 0, 0.12),
+})
+
+
+class HeatShimmer:
+    # The shimmer as a camera post-process. The camera filter is shared by every
+    # scene, so the scene switches it on in enter() and off again in exit().
+    # tint is blended in up to `warmth` at the bottom of the screen.
+    def __init__(self, strength=0.003, horizon=0.6, tint=color.orange, warmth=0.12):
+        self.inputs = {
+            'strength': strength,
+            'horizon': horizon,
+            'tint': color.rgba(tint[0], tint[1], tint[2], warmth),
+        }
+        self.enabled = False
+        self._near = None
+
+    @staticmethod
+    def supported():
+        # The software renderer (p3tinydisplay) has no shaders; the drill still runs without the shimmer
+        win = application.base.win
+        return win is not None and win.gsg is not None and win.gsg.supports_basic_shaders
+
+    def enable(self):
+        if self.enabled or not self.supported():
+            return
+        # Setting a camera shader moves the near clip plane; put it back on disable()
+        self._near = camera.clip_plane_near
+        camera.shader = shimmer_shader
+        for name, value in self.inputs.items():
+            camera.set_shader_input(name, value)
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        camera.shader = None
+        camera.clip_plane_near = self._near
+        self.enabled = False
+
+
+# --- Rising heat particles: one static mesh, moved entirely in the vertex shader ---
+heat_particle_shader = Shader(name='heat_particles', vertex='''
+#version 140
+
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat4 p3d_ProjectionMatrix;
+uniform float osg_FrameTime;
+uniform float bottom;
+uniform float top;
+in vec4 p3d_Vertex;
+in vec2 corner;
+in vec2 params;
+out vec2 offset;
+out float fade;
+
+void main() {
+    float t = osg_FrameTime;
+    float height = top - bottom;
+    // params: size, rise speed in units per second; wraps back to the bottom at the top
+    float rise = mod(p3d_Vertex.y - bottom + params.y * t, height);
+    vec4 base = vec4(p3d_Vertex.x + 0.15 * sin(t * 1.7 + p3d_Vertex.x * 3.0), bottom + rise, p3d_Vertex.z, 1.0);
+    // Camera-facing quad around the particle; size is its diameter
+    vec4 view = p3d_ModelViewMatrix * base;
+    view.xy += corner * (0.5 * params.x);
+    gl_Position = p3d_ProjectionMatrix * view;
+    offset = corner;
+    fade = sin(3.14159 * rise / height);
+}
+''', fragment='''
+#version 140
+
+uniform vec4 tint;
+in vec2 offset;
+in float fade;
+out vec4 color;
+
+void main() {
+    float r = dot(offset, offset);
+    if (r > 1.0) discard;
+    color = vec4(tint.rgb, tint.a * fade * (1.0 - r));
+}
+''', default_input={
+    'bottom': 1.0,
+    'top': 5.0,
+    'tint': color.yellow,
+})
+
+_CORNERS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+_QUAD = np.array([(0, 1, 2), (0, 2, 3)], dtype=np.uint32)
+
+
+def _particle_format():
+    array = GeomVertexArrayFormat()
+    array.add_column(InternalName.get_vertex(), 3, Geom.NT_float32, Geom.C_point)
+    array.add_column(InternalName.make('corner'), 2, Geom.NT_float32, Geom.C_other)
+    array.add_column(InternalName.make('params'), 2, Geom.NT_float32, Geom.C_other)
+    return GeomVertexFormat.register_format(array)
+
+
+class HeatParticles(Entity):
+    # Glowing specks of hot air drifting up from the ground. The layout points
+    # (x, y, z, size, speed) are written once; the vertex shader rises, sways,
+    # wraps and fades every particle, so the field is a single draw call with
+    # no per-frame Python and motion that does not depend on the frame rate.
+    def __init__(self, points, bottom=1.0, top=5.0, tint=color.yellow, alpha=0.6, **kwargs):
+        super().__init__(**kwargs)
+        points = np.asarray(points, dtype=np.float32)
+        count = len(points)
+        triangles = _QUAD[None] + (np.arange(count, dtype=np.uint32) * 4)[:, None, None]
+        self.geom_node = make_geom_node('heat', count * 4, triangles, dynamic=False, fmt=_particle_format())
+        # The vertices move on the GPU, so Panda3D's bounds would be wrong
+        self.geom_node.set_bounds(OmniBoundingVolume())
+        self.geom_node.set_final(True)
+        self.attach_new_node(self.geom_node)
+
+        verts = vertex_view(self.geom_node, columns=7).reshape(count, 4, 7)
+        verts[..., :3] = points[:, None, :3]
+        verts[..., 3:5] = _CORNERS
+        verts[..., 5:7] = points[:, None, 3:5]
+
+        self.shader = heat_particle_shader
+        self.set_shader_input('bottom', bottom)
+        self.set_shader_input('top', top)
+        self.set_shader_input('tint', color.rgba(tint[0], tint[1], tint[2], alpha))
+        # Additive glow, drawn after the opaque scene without hiding what is behind
+        self.set_transparency(TransparencyAttrib.M_alpha)
+        self.set_attrib(ColorBlendAttrib.make(ColorBlendAttrib.M_add, ColorBlendAttrib.O_incoming_alpha,
+                                              ColorBlendAttrib.O_one))
+        self.set_depth_write(False)
+        self.set_bin('transparent', 0)
@@ -0,0 +1,27 @@
+from ursina import Text, color
+
+
+class HudLabel(Text):
+    # A Text whose glyph geometry is regenerated only when the displayed
+    # integer or warning state changes, not on every frame it is refreshed.
+    def __init__(self, template, value=0, warn_below=None, warn_color=color.red,
+                 base_color=color.white, **kwargs):
+        self.template = template
+        self.warn_below = warn_below
+        self.warn_color = warn_color
+        self.base_color = base_color
+        self.shown = int(value)
+        self.warning = warn_below is not None and value < warn_below
+        kwargs.setdefault('color', warn_color if self.warning else base_color)
+        super().__init__(text=template.format(self.shown), **kwargs)
+
+    def show(self, value):
+        shown = int(value)
+        if shown != self.shown:
+            self.shown = shown
+            self.text = self.template.format(shown)
+        if self.warn_below is not None:
+            warning = value < self.warn_below
+            if warning != self.warning:
+                self.warning = warning
+                self.color = self.warn_color if warning else self.base_color
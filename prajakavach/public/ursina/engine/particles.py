@@ -0,0 +1,116 @@
+import numpy as np
+from ursina import Entity, color
+
+from engine.geometry import make_geom_node, vertex_view
+
+
+# Octahedron used as the per-particle shape (6 vertices, 8 faces).
+_SHAPE_VERTICES = np.array([
+    (1, 0, 0), (-1, 0, 0),
+    (0, 1, 0), (0, -1, 0),
+    (0, 0, 1), (0, 0, -1),
+], dtype=np.float32) * 0.5
+_SHAPE_TRIANGLES = np.array([
+    (0, 2, 4), (2, 1, 4), (1, 3, 4), (3, 0, 4),
+    (2, 0, 5), (1, 2, 5), (3, 1, 5), (0, 3, 5),
+], dtype=np.uint32)
+
+
+class DebrisField(Entity):
+    # Debris stored as NumPy arrays and drawn as one merged mesh, so the whole
+    # field costs one vectorized step and one draw call per frame.
+    def __init__(self, count=300, x_range=(-50, 50), y_range=(5, 15), z_range=(-10, 10),
+                 size_range=(0.05, 0.2), speed_range=(3.0, 9.0), floor=0.1, jitter=0.02,
+                 seed=None, points=None, **kwargs):
+        kwargs.setdefault('color', color.gray)
+        super().__init__(**kwargs)
+        self.count = count
+        self.ranges = (x_range, y_range, z_range)
+        self.size_range = size_range
+        self.speed_range = speed_range
+        self.floor = floor
+        self.jitter = jitter
+        self.seed = seed
+        # Optional fixed start layout: (count, 5) rows of x, y, z, size, speed
+        self.points = None if points is None else np.asarray(points, dtype=np.float32)
+        if self.points is not None:
+            count = self.count = len(self.points)
+
+        triangles = (_SHAPE_TRIANGLES[None, :, :]
+                     + (np.arange(count, dtype=np.uint32) * len(_SHAPE_VERTICES))[:, None, None])
+        self.geom_node = make_geom_node('debris', count * len(_SHAPE_VERTICES), triangles)
+        self.attach_new_node(self.geom_node)
+        self.reset()
+
+    def reset(self):
+        # Reseeded so every restart falls the same way, whatever ran before
+        self.rng = np.random.default_rng(self.seed)
+        n = self.count
+        if self.points is not None:
+            self.positions = self.points[:, :3].copy()
+            self.sizes = self.points[:, 3].copy()
+            self.speeds = self.points[:, 4].copy()
+        else:
+            low = np.array([r[0] for r in self.ranges], dtype=np.float32)
+            high = np.array([r[1] for r in self.ranges], dtype=np.float32)
+            self.positions = self.rng.uniform(low, high, (n, 3)).astype(np.float32)
+            self.speeds = self.rng.uniform(*self.speed_range, n).astype(np.float32)
+            self.sizes = self.rng.uniform(*self.size_range, n).astype(np.float32)
+        self._offsets = _SHAPE_VERTICES[None, :, :] * self.sizes[:, None, None]
+        self._jitter = np.empty((n, 2), dtype=np.float32)
+        self.sync()
+
+    def step(self, dt):
+        # Call once per fixed step: speeds are units per second and the sideways
+        # jitter is per step, so the field falls the same at any frame rate.
+        # Only moves the pieces; sync() redraws them.
+        p = self.positions
+        p[:, 1] -= self.speeds * dt
+        jitter = self._jitter
+        self.rng.random(dtype=np.float32, out=jitter)
+        jitter *= 2 * self.jitter
+        jitter -= self.jitter
+        p[:, 0] += jitter[:, 0]
+        p[:, 2] += jitter[:, 1]
+        np.maximum(p[:, 1], self.floor, out=p[:, 1])
+
+    def sync(self, rows=None):
+        verts = vertex_view(self.geom_node).reshape(self.count, len(_SHAPE_VERTICES), 3)
+        if rows is None:
+            np.add(self.positions[:, None, :], self._offsets, out=verts)
+        else:
+            verts[rows] = self.positions[rows, None, :] + self._offsets[rows]
+
+
+# Box used per crowd agent (8 vertices, 12 faces), standing on y = 0.
+_BOX_VERTICES = np.array([
+    (x, y, z) for x in (-0.5, 0.5) for y in (0.0, 1.0) for z in (-0.5, 0.5)
+], dtype=np.float32)
+_BOX_TRIANGLES = np.array([
+    (0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5),  # -x, +x
+    (0, 4, 5), (0, 5, 1), (2, 3, 7), (2, 7, 6),  # -y, +y
+    (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3),  # -z, +z
+], dtype=np.uint32)
+
+
+class CrowdMesh(Entity):
+    # Every crowd agent as a box in one merged mesh. Positions come from
+    # simulation.crowd as (count, 2) x, z rows; hidden agents sink below the ground.
+    def __init__(self, count, size=(0.4, 1.2, 0.4), **kwargs):
+        kwargs.setdefault('color', color.orange)
+        super().__init__(**kwargs)
+        self.count = count
+        triangles = (_BOX_TRIANGLES[None, :, :]
+                     + (np.arange(count, dtype=np.uint32) * len(_BOX_VERTICES))[:, None, None])
+        self.geom_node = make_geom_node('crowd', count * len(_BOX_VERTICES), triangles)
+        self.attach_new_node(self.geom_node)
+        self._offsets = _BOX_VERTICES * np.array(size, dtype=np.float32)
+        self._centres = np.zeros((count, 3), dtype=np.float32)
+
+    def sync(self, positions, visible):
+        c = self._centres
+        c[:, 0] = positions[:, 0]
+        c[:, 2] = positions[:, 1]
+        c[:, 1] = np.where(visible, 0.0, -10.0)
+        verts = vertex_view(self.geom_node).reshape(self.count, len(_BOX_VERTICES), 3)
+        np.add(c[:, None, :], self._offsets[None], out=verts)
@@ -0,0 +1,56 @@
+from ursina import Entity
+
+
+class EntityPool:
+    # A fixed set of entities created up front and lent out, so effects that
+    # come and go (bursts, splashes, dust) never create or destroy Panda3D nodes
+    # mid-drill. Idle entities stay in the scene graph, just hidden.
+    # on_acquire(entity) / on_release(entity) reset whatever the effect changes.
+    def __init__(self, capacity, parent=None, on_acquire=None, on_release=None, **entity_kwargs):
+        self.capacity = capacity
+        self.on_acquire = on_acquire
+        self.on_release = on_release
+        self.free = [Entity(parent=parent, visible=False, **entity_kwargs) for _ in range(capacity)]
+        self.active = []
+        self.dropped = 0  # acquire() calls that found nothing free
+
+    def __len__(self):
+        return len(self.active)
+
+    def acquire(self, **attrs):
+        # Returns None when every entity is in use; callers skip the effect rather than allocate
+        if not self.free:
+            self.dropped += 1
+            return None
+        entity = self.free.pop()
+        for name, value in attrs.items():
+            setattr(entity, name, value)
+        if self.on_acquire is not None:
+            self.on_acquire(entity)
+        entity.visible = True
+        entity.pool_slot = len(self.active)
+        self.active.append(entity)
+        return entity
+
+    def release(self, entity):
+        # Swap with the last active entity so release is O(1)
+        active = self.active
+        last = active.pop()
+        if last is not entity:
+            active[entity.pool_slot] = last
+            last.pool_slot = entity.pool_slot
+        entity.visible = False
+        if self.on_release is not None:
+            self.on_release(entity)
+        self.free.append(entity)
+
+    def release_all(self):
+        while self.active:
+            self.release(self.active[-1])
+
+    def expire(self, dt):
+        # For entities acquired with a `life` in seconds: count down and release
+        for entity in reversed(self.active):
+            entity.life -= dt
+            if entity.life <= 0:
+                self.release(entity)
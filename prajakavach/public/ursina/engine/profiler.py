@@ -0,0 +1,167 @@
+import atexit
+import csv
+import json
+import os
+import sys
+import time as _time
+from collections import deque
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(HERE, 'profiles')
+
+# Opt in with PRAJAKAVACH_PROFILE=1 or by passing --profile to any drill script
+ENABLED = os.environ.get('PRAJAKAVACH_PROFILE') == '1' or '--profile' in sys.argv
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    enabled = False
+    _phase = _NullPhase()
+
+    def phase(self, name):
+        return self._phase
+
+    def note(self, name, ms):
+        pass
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = _time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, _time.perf_counter())
+        return False
+
+
+class Profiler:
+    # Times named phases of the update functions plus Panda3D's render step, and
+    # keeps a rolling window of frames for percentiles and a trace for export.
+    enabled = True
+
+    def __init__(self, window=300, history=20000):
+        self.frames = deque(maxlen=window)
+        self.trace = deque(maxlen=history)
+        self.phases = {}
+        self.order = []
+        self.current = {}
+        self.frame_start = None
+        self.render_start = 0.0
+        self.frame_index = 0
+        self.origin = _time.perf_counter()
+        self.overlay = None
+        self.notes = {}  # one-off timings (a scene switch), shown under the phases
+
+    def phase(self, name):
+        p = self.phases.get(name)
+        if p is None:
+            p = self.phases[name] = _Phase(self, name)
+            self.order.append(name)
+        return p
+
+    def note(self, name, ms):
+        self.notes[name] = ms
+
+    def record(self, name, start, end):
+        self.current[name] = self.current.get(name, 0.0) + (end - start)
+        self.trace.append((self.frame_index, name, start, end - start))
+
+    # --- Panda3D task hooks around the whole frame and the render step ---
+    def _frame_task(self, task):
+        now = _time.perf_counter()
+        if self.frame_start is not None:
+            self.current['frame'] = now - self.frame_start
+            self.trace.append((self.frame_index, 'frame', self.frame_start, now - self.frame_start))
+            self.frames.append(self.current)
+            self.frame_index += 1
+        self.current = {}
+        self.frame_start = now
+        return task.cont
+
+    def _render_begin_task(self, task):
+        self.render_start = _time.perf_counter()
+        return task.cont
+
+    def _render_end_task(self, task):
+        self.record('render', self.render_start, _time.perf_counter())
+        return task.cont
+
+    def install(self, task_mgr):
+        task_mgr.add(self._frame_task, 'profiler-frame', sort=-100)
+        task_mgr.add(self._render_begin_task, 'profiler-render-begin', sort=49)
+        task_mgr.add(self._render_end_task, 'profiler-render-end', sort=51)
+
+    def percentiles(self, qs=(50, 95, 99)):
+        # {phase: [ms at each percentile]} over the rolling window
+        out = {}
+        for name in self.order + ['render', 'frame']:
+            values = sorted(f.get(name, 0.0) for f in self.frames)
+            if values:
+                out[name] = [values[min(len(values) - 1, len(values) * q // 100)] * 1000 for q in qs]
+        return out
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'phase', 'start_ms', 'duration_ms'])
+            for frame, name, start, duration in self.trace:
+                writer.writerow([frame, name, f'{(start - self.origin) * 1000:.3f}', f'{duration * 1000:.3f}'])
+
+    def export_chrome_trace(self, path):
+        # Load in chrome://tracing or https://ui.perfetto.dev
+        events = [
+            {'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': 0, 'args': {'frame': frame},
+             'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6}
+            for frame, name, start, duration in self.trace
+        ]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def export(self, directory=DEFAULT_DIR):
+        if not self.trace:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, f"frames-{_time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+        self.export_csv(stem + '.csv')
+        self.export_chrome_trace(stem + '.json')
+        print(f'Profile written to {stem}.csv and {stem}.json')
+        return stem
+
+
+_profiler = NullProfiler()
+
+
+def get():
+    return _profiler
+
+
+def install():
+    # Called by the SceneManager once the Ursina app exists
+    global _profiler
+    if not ENABLED or _profiler.enabled:
+        return _profiler
+    from direct.showbase import ShowBaseGlobal
+    from engine.profiler_overlay import ProfilerOverlay
+
+    _profiler = Profiler()
+    _profiler.install(ShowBaseGlobal.base.taskMgr)
+    _profiler.overlay = ProfilerOverlay(_profiler)
+    atexit.register(_profiler.export)
+    return _profiler
@@ -0,0 +1,40 @@
+from ursina import Entity, Text, camera, color, time, window
+
+
+class ProfilerOverlay(Entity):
+    # Rolling p50/p95/p99 per phase, refreshed twice a second. F9 exports
+    # the recorded frames as CSV and Chrome trace JSON.
+    def __init__(self, profiler, refresh=0.5, budget_ms=16.7):
+        super().__init__(parent=camera.ui)
+        self.profiler = profiler
+        self.refresh = refresh
+        self.budget_ms = budget_ms
+        self.elapsed = 0.0
+        self.text = Text(
+            parent=self,
+            text='',
+            position=window.top_left + (0.02, -0.06),
+            scale=0.75,
+            font='VeraMono.ttf',
+            background=True,
+            background_color=color.black66,
+        )
+
+    def update(self):
+        self.elapsed += time.dt
+        if self.elapsed < self.refresh:
+            return
+        self.elapsed = 0.0
+        stats = self.profiler.percentiles()
+        lines = [f"{'phase':<12}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, (p50, p95, p99) in stats.items():
+            lines.append(f'{name:<12}{p50:7.2f}{p95:7.2f}{p99:7.2f}')
+        for name, ms in self.profiler.notes.items():
+            lines.append(f'{name:<12}{ms:7.2f} ms last')
+        self.text.text = '\n'.join(lines)
+        frame_p95 = stats.get('frame', [0.0, 0.0, 0.0])[1]
+        self.text.color = color.red if frame_p95 > self.budget_ms else color.white
+
+    def input(self, key):
+        if key == 'f9':
+            self.profiler.export()
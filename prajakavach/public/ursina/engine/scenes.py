@@ -0,0 +1,199 @@
+import os
+import random
+import time as _time
+
+from ursina import (
+    AmbientLight,
+    DirectionalLight,
+    Entity,
+    Ursina,
+    Vec3,
+    application,
+    camera,
+    color,
+    window,
+)
+
+from engine import profiler, scores, telemetry
+from simulation import mapgen
+from simulation.common import NO_INPUT
+from simulation.replay import Recording, get_writer
+
+
+# Set PRAJAKAVACH_SEED to give every student in a class the same layout
+CLASS_SEED = os.environ.get('PRAJAKAVACH_SEED')
+
+
+def setup_window(title, fps_counter=True):
+    window.title = title
+    window.borderless = False
+    window.fullscreen = False
+    window.exit_button.visible = True
+    window.fps_counter.enabled = fps_counter
+
+
+class Scene(Entity):
+    # A drill or menu that is built once and then switched in and out.
+    # World entities are parented to the scene, HUD entities to self.ui, so
+    # disabling the scene hides both without destroying any Panda3D nodes.
+    title = ''
+    ambient_color = color.rgba(100, 100, 100, 0.5)
+    background = None  # window colour; None keeps Ursina's default
+    fps_counter = True
+
+    def __init__(self, manager=None):
+        super().__init__(enabled=False)
+        self.manager = manager
+        self.ui = Entity(parent=camera.ui, enabled=False)
+        self.build()
+
+    def build(self):
+        pass
+
+    def enter(self):
+        setup_window(self.title, self.fps_counter)
+        self.setup_camera()
+        self.enabled = True
+        self.ui.enabled = True
+        self.on_enter()
+
+    def exit(self):
+        self.on_exit()
+        self.enabled = False
+        self.ui.enabled = False
+
+    def setup_camera(self):
+        camera.orthographic = False
+        camera.fov = 40
+        camera.position = (0, 0, -20)
+        camera.rotation = (0, 0, 0)
+
+    def on_enter(self):
+        pass
+
+    def on_exit(self):
+        pass
+
+
+class DrillScene(Scene):
+    # Side-view camera shared by all four drills; every entry starts a fresh attempt.
+    # The seed picks the map layout (simulation.mapgen). Each attempt's seed and
+    # per-step inputs are recorded to replays/; passing `playback` (a Recording)
+    # drives the scene from that file instead of the keyboard.
+    scenario = ''
+
+    def __init__(self, manager=None, seed=None, playback=None):
+        if seed is None:
+            if playback:
+                seed = playback.seed
+            elif CLASS_SEED:
+                seed = int(CLASS_SEED)
+            else:
+                seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.layout = mapgen.generate(self.scenario, seed)
+        self.rng = random.Random(seed)  # cosmetic motion only
+        self.playback = playback
+        self.recording = None
+        self._replay_inputs = None
+        # Open the score database, replay writer and telemetry log now rather than mid-drill
+        scores.get_store()
+        if playback is None:
+            get_writer()
+        self.telemetry = telemetry.NullLog() if playback else telemetry.get_log()
+        self.profiler = profiler.get()
+        super().__init__(manager)
+
+    def setup_camera(self):
+        camera.orthographic = True
+        camera.fov = 25
+        camera.position = (0, 8, -25)
+        camera.rotation = (0, 0, 0)
+        camera.look_at(Vec3(0, 2, 0))
+
+    def on_enter(self):
+        self.restart()
+
+    def restart(self):
+        pass
+
+    def start_attempt(self, state):
+        player = state.player
+        self.telemetry.start(self.scenario, player.x, player.y)
+        if self.playback is not None:
+            self._replay_inputs = self.playback.inputs()
+        else:
+            self.recording = Recording(self.scenario, state.seed, self.clock.dt)
+
+    def step_inputs(self, inputs):
+        # Called once per fixed step with the inputs read this frame
+        if self._replay_inputs is not None:
+            return next(self._replay_inputs, NO_INPUT)
+        self.recording.record(inputs)
+        return inputs
+
+    def finish_attempt(self, state, remaining):
+        player = state.player
+        self.telemetry.end(state.outcome, player.x, player.y, remaining)
+        if self.playback is not None:
+            return
+        scores.record(self.scenario, state.score, state.outcome)
+        self.recording.finish(state)
+        # Written by the replay writer thread, never inside the frame update
+        get_writer().save(self.recording, tag=self.telemetry.attempt)
+
+
+class SceneManager(Entity):
+    # Keeps every scene loaded inside one Ursina process so switching between the
+    # menu and a drill is an enable/disable instead of a new interpreter.
+    def __init__(self, scenes, home, preload=True):
+        super().__init__()
+        profiler.install()
+        self.factories = dict(scenes)
+        self.home = home
+        self.scenes = {}
+        self.current = None
+        self.current_name = None
+        self.last_switch_ms = 0.0
+        self.default_background = window.color
+
+        # One set of lights for every scene; scenes only change the ambient colour
+        self.sun = DirectionalLight(y=5, z=-5, rotation=(45, -45, 0))
+        self.ambient = AmbientLight(color=Scene.ambient_color)
+
+        if preload:
+            for name in self.factories:
+                self.get(name)
+        self.show(home)
+
+    def get(self, name):
+        if name not in self.scenes:
+            self.scenes[name] = self.factories[name](manager=self)
+        return self.scenes[name]
+
+    def show(self, name):
+        start = _time.perf_counter()
+        if self.current is not None:
+            self.current.exit()
+        scene = self.get(name)
+        self.ambient.color = scene.ambient_color
+        window.color = scene.background or self.default_background
+        scene.enter()
+        self.current = scene
+        self.current_name = name
+        self.last_switch_ms = (_time.perf_counter() - start) * 1000
+        profiler.get().note('switch', self.last_switch_ms)
+
+    def input(self, key):
+        if key == 'escape':
+            if self.current_name == self.home:
+                application.quit()
+            else:
+                self.show(self.home)
+
+
+def run_standalone(scene_cls):
+    # Lets a drill script still be started directly: python floods.py
+    app = Ursina()
+    SceneManager({'main': scene_cls}, home='main')
+    app.run()
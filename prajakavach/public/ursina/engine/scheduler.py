@@ -0,0 +1,64 @@
+from simulation.common import FIXED_DT, MAX_CATCH_UP, FixedStepper
+
+
+class TickGroup:
+    # Work that runs at a lower rate than the simulation (the crowd, the HUD,
+    # telemetry). It counts fixed steps rather than seconds of frame time, so
+    # it ticks at the same simulated moments on a 60 Hz and a 144 Hz screen.
+    def __init__(self, interval, step_dt):
+        self.every = max(1, round(interval / step_dt))
+        self.dt = self.every * step_dt
+        self.count = 0
+        self.ticks = 0  # ticks due this frame
+        self.alpha = 0.0  # how far real time is into the next tick
+
+    def advance(self, steps, step_alpha=0.0):
+        self.count += steps
+        self.ticks, self.count = divmod(self.count, self.every)
+        self.alpha = (self.count + step_alpha) / self.every
+        return self.ticks
+
+    def reset(self):
+        self.count = 0
+        self.ticks = 0
+        self.alpha = 0.0
+
+
+class Scheduler:
+    # One clock per scene. advance(time.dt) turns the frame time into fixed
+    # simulation steps (with the FixedStepper catch-up limit) and tells each
+    # tick group how many of its ticks fell in this frame. alpha is how far
+    # real time is into the next step, for drawing between two states.
+    def __init__(self, dt=FIXED_DT, max_steps=MAX_CATCH_UP):
+        self.stepper = FixedStepper(dt, max_steps)
+        self.groups = {}
+        self.steps = 0  # fixed steps due this frame
+
+    @property
+    def dt(self):
+        return self.stepper.dt
+
+    @property
+    def alpha(self):
+        return self.stepper.alpha
+
+    def group(self, name, interval):
+        if name not in self.groups:
+            self.groups[name] = TickGroup(interval, self.stepper.dt)
+        return self.groups[name]
+
+    def advance(self, frame_dt):
+        self.steps = self.stepper.advance(frame_dt)
+        alpha = self.stepper.alpha
+        for group in self.groups.values():
+            group.advance(self.steps, alpha)
+        return self.steps
+
+    def due(self, name):
+        return self.groups[name].ticks
+
+    def reset(self):
+        self.stepper.reset()
+        self.steps = 0
+        for group in self.groups.values():
+            group.reset()
@@ -0,0 +1,121 @@
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(HERE, 'scores.db')
+LEGACY_JSON = os.path.join(HERE, 'scores.json')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scenario TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    outcome TEXT,
+    created_at REAL NOT NULL,
+    pid INTEGER
+);
+CREATE INDEX IF NOT EXISTS attempts_scenario ON attempts (scenario);
+"""
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=5.0)
+    # WAL lets several drill processes append while others read totals
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+class ScoreStore:
+    # Append-only attempt log in SQLite. record() only enqueues; a background
+    # thread commits batches in single transactions, so the frame loop never
+    # touches the disk and concurrent processes never overwrite each other.
+    def __init__(self, path=None):
+        if path is None:
+            path = DEFAULT_PATH
+        self.path = path
+        self.queue = queue.Queue()
+        conn = _connect(path)
+        conn.executescript(_SCHEMA)
+        # Take the write lock first so two processes starting together import once
+        conn.execute('BEGIN IMMEDIATE')
+        self._import_legacy(conn)
+        conn.commit()
+        conn.close()
+        self.thread = threading.Thread(target=self._run, name='score-writer', daemon=True)
+        self.thread.start()
+
+    def _import_legacy(self, conn):
+        # Carry over the totals from the old scores.json once
+        if conn.execute('SELECT COUNT(*) FROM attempts').fetchone()[0] or not os.path.exists(LEGACY_JSON):
+            return
+        try:
+            with open(LEGACY_JSON, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return
+        conn.executemany(
+            'INSERT INTO attempts (scenario, score, outcome, created_at, pid) VALUES (?, ?, ?, ?, ?)',
+            [(name, int(total), 'imported', time.time(), None) for name, total in legacy.items()],
+        )
+
+    def record(self, scenario, score, outcome=None):
+        self.queue.put((scenario, int(score), outcome, time.time(), os.getpid()))
+
+    def _run(self):
+        conn = _connect(self.path)
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [row for row in batch if row is not None]
+            if rows:
+                with conn:
+                    conn.executemany(
+                        'INSERT INTO attempts (scenario, score, outcome, created_at, pid) VALUES (?, ?, ?, ?, ?)',
+                        rows,
+                    )
+            for _ in batch:
+                self.queue.task_done()
+            if None in batch:
+                conn.close()
+                return
+
+    def flush(self):
+        self.queue.join()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def totals(self):
+        conn = _connect(self.path)
+        try:
+            return dict(conn.execute('SELECT scenario, SUM(score) FROM attempts GROUP BY scenario'))
+        finally:
+            conn.close()
+
+
+_store = None
+
+
+def get_store():
+    # Opened by the first drill scene; every drill in the process records into it
+    global _store
+    if _store is None:
+        _store = ScoreStore()
+        atexit.register(_store.close)
+    return _store
+
+
+def record(scenario, score, outcome=None):
+    get_store().record(scenario, score, outcome)
@@ -0,0 +1,197 @@
+import argparse
+import atexit
+import os
+import queue
+import random
+import struct
+import threading
+import time
+from collections import Counter, namedtuple
+
+from simulation.definitions import scenario_ids
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(HERE, 'telemetry')
+
+# --- File format ---
+# Header: MAGIC + version byte. Then blocks of [u32 byte length][records...],
+# each record a fixed 22-byte struct, so a reader holds one block at a time.
+MAGIC = b'PKTL'
+VERSION = 1
+RECORD = struct.Struct('<IBBffff')  # attempt, kind, scenario, t, x, y, value
+BLOCK_HEADER = struct.Struct('<I')
+
+START, POSITION, PICKUP, SUCCESS, DROWNED, TIMEOUT, EXHAUSTED, DEHYDRATED, INJURED, HIT, EVACUATED = range(11)
+KIND_NAMES = ['start', 'position', 'pickup', 'success', 'drowned', 'timeout',
+              'exhausted', 'dehydrated', 'injured', 'hit', 'evacuated']
+OUTCOME_KINDS = {name: KIND_NAMES.index(name) for name in KIND_NAMES[SUCCESS:INJURED + 1]}
+# Scenario byte is the definition's id, which never changes once assigned
+SCENARIO_IDS = scenario_ids()
+SCENARIO_NAMES = {i: name for name, i in SCENARIO_IDS.items()}
+
+Event = namedtuple('Event', 'attempt kind scenario t x y value')
+
+
+class TelemetryLog:
+    # Events are packed into a preallocated bytearray (one pack_into per event).
+    # A full buffer is handed to a writer thread as one block and a fresh one
+    # is used, so emitting never waits on the disk.
+    def __init__(self, path=None, capacity=4096, sample_interval=0.1):
+        if path is None:
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            path = os.path.join(DEFAULT_DIR, f'session-{stamp}-{os.getpid()}.pktl')
+        self.path = path
+        self.capacity = capacity
+        self.sample_interval = sample_interval
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.count = 0
+        self.attempt = 0
+        self.scenario = 0
+        self.t0 = time.perf_counter()
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name='telemetry-writer', daemon=True)
+        self.thread.start()
+
+    def start(self, scenario, x=0.0, y=0.0):
+        self.attempt = random.getrandbits(32)
+        self.scenario = SCENARIO_IDS[scenario]
+        self.t0 = time.perf_counter()
+        self.emit(START, x, y)
+
+    def emit(self, kind, x=0.0, y=0.0, value=0.0, t=None):
+        if t is None:
+            t = time.perf_counter() - self.t0
+        RECORD.pack_into(self.buffer, self.count * RECORD.size,
+                         self.attempt, kind, self.scenario, t, x, y, value)
+        self.count += 1
+        if self.count == self.capacity:
+            self.flush()
+
+    def position(self, x, y, distance):
+        # Scenes call this from a tick group every sample_interval of simulation time
+        self.emit(POSITION, x, y, distance)
+
+    def end(self, outcome, x, y, remaining):
+        self.emit(OUTCOME_KINDS[outcome], x, y, remaining)
+        self.flush()
+
+    def flush(self):
+        if self.count:
+            self.queue.put(bytes(memoryview(self.buffer)[:self.count * RECORD.size]))
+            self.count = 0
+
+    def _run(self):
+        with open(self.path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(MAGIC + bytes([VERSION]))
+            while True:
+                block = self.queue.get()
+                if block is None:
+                    return
+                f.write(BLOCK_HEADER.pack(len(block)))
+                f.write(block)
+                f.flush()
+
+    def close(self):
+        self.flush()
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+
+class NullLog:
+    # Stands in for TelemetryLog when an attempt must not be logged (replays)
+    attempt = 0
+    sample_interval = 0.1
+
+    def start(self, scenario, x=0.0, y=0.0):
+        pass
+
+    def emit(self, kind, x=0.0, y=0.0, value=0.0, t=None):
+        pass
+
+    def position(self, x, y, distance):
+        pass
+
+    def end(self, outcome, x, y, remaining):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def read_events(path):
+    # Stream events block by block; memory use does not grow with file size
+    with open(path, 'rb') as f:
+        header = f.read(len(MAGIC) + 1)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a telemetry log')
+        while True:
+            size = f.read(BLOCK_HEADER.size)
+            if len(size) < BLOCK_HEADER.size:
+                return
+            block = f.read(BLOCK_HEADER.unpack(size)[0])
+            for record in RECORD.iter_unpack(block):
+                yield Event(*record)
+
+
+_log = None
+
+
+def get_log():
+    global _log
+    if _log is None:
+        _log = TelemetryLog()
+        atexit.register(_log.close)
+    return _log
+
+
+def summarize(paths):
+    outcomes = Counter()
+    pickups = Counter()
+    hits = Counter()
+    evacuations = {}
+    durations = {}
+    closest = {}
+    events = 0
+    for path in paths:
+        for e in read_events(path):
+            events += 1
+            scenario = SCENARIO_NAMES.get(e.scenario, f'#{e.scenario}')
+            if e.kind == POSITION:
+                key = (scenario, e.attempt)
+                closest[key] = min(closest.get(key, e.value), e.value)
+            elif e.kind == PICKUP:
+                pickups[scenario] += 1
+            elif e.kind == HIT:
+                hits[scenario] += 1
+            elif e.kind == EVACUATED:
+                evacuations.setdefault(scenario, []).append(e.value)
+            elif e.kind >= SUCCESS:
+                outcomes[scenario, KIND_NAMES[e.kind]] += 1
+                durations.setdefault(scenario, []).append(e.t)
+    print(f'{events} events')
+    for scenario in sorted(durations):
+        times = durations[scenario]
+        near = [d for (s, _), d in closest.items() if s == scenario]
+        results = ', '.join(f'{o}={n}' for (s, o), n in sorted(outcomes.items()) if s == scenario)
+        print(f'{scenario}: {len(times)} attempts ({results}), mean {sum(times) / len(times):.1f}s, '
+              f'closest approach mean {sum(near) / max(len(near), 1):.1f}, pickups {pickups[scenario]}, '
+              f'debris hits {hits[scenario]}')
+        if scenario in evacuations:
+            crowd = evacuations[scenario]
+            print(f'  crowd evacuated {len(crowd)} times, mean {sum(crowd) / len(crowd):.1f}s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize drill telemetry logs.')
+    parser.add_argument('paths', nargs='+')
+    summarize(parser.parse_args().paths)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import numpy as np
+from ursina import Entity, color
+
+from engine.geometry import make_geom_node, vertex_view
+
+DRY_OFFSET = -0.2  # dry vertices sink below the ground plane
+
+
+class WaterSurface(Entity):
+    # Heightfield mesh that follows a FloodGrid's depth. `stride` samples
+    # every n-th cell so a 256x256 solver can drive a lighter 129x129 mesh.
+    # The vertex buffer is allocated once; each frame only the rows whose
+    # height moved by more than `tolerance` are written, through a NumPy
+    # view of Panda3D's array, and an unchanged surface is not touched at all.
+    def __init__(self, flood, stride=2, min_depth=0.02, tolerance=0.002, **kwargs):
+        kwargs.setdefault('color', color.blue)
+        super().__init__(**kwargs)
+        self.flood = flood
+        self.stride = stride
+        self.min_depth = min_depth
+        self.tolerance = tolerance
+        rows = len(range(0, flood.rows, stride))
+        cols = len(range(0, flood.cols, stride))
+        self.shape = (rows, cols)
+
+        idx = np.arange(rows * cols, dtype=np.uint32).reshape(rows, cols)
+        a, b = idx[:-1, :-1].ravel(), idx[:-1, 1:].ravel()
+        c, d = idx[1:, :-1].ravel(), idx[1:, 1:].ravel()
+        triangles = np.concatenate([np.stack([a, c, b], 1), np.stack([b, c, d], 1)])
+        self.geom_node = make_geom_node('water', rows * cols, triangles)
+        self.attach_new_node(self.geom_node)
+
+        # x and z never change; only the height column is rewritten
+        half = flood.extent / 2
+        xs = np.arange(0, flood.cols, stride) * flood.cell + flood.cell / 2 - half
+        zs = np.arange(0, flood.rows, stride) * flood.cell + flood.cell / 2 - half
+        self._grid_x, self._grid_z = np.meshgrid(xs, zs)
+
+        # Scratch buffers reused every frame
+        self._heights = np.empty(self.shape, dtype=np.float32)
+        self._uploaded = np.empty(self.shape, dtype=np.float32)
+        self._wet = np.empty(self.shape, dtype=bool)
+        self._diff = np.empty(self.shape, dtype=np.float32)
+        self._changed = np.empty(self.shape, dtype=bool)
+        self.rows_written = 0
+        self.sync(full=True)
+
+    def set_flood(self, flood):
+        self.flood = flood
+        self.sync(full=True)
+
+    def heights(self):
+        depth = self.flood.depth[::self.stride, ::self.stride]
+        np.greater(depth, self.min_depth, out=self._wet)
+        self._heights.fill(DRY_OFFSET)
+        np.copyto(self._heights, depth, where=self._wet)
+        return self._heights
+
+    def sync(self, full=False):
+        heights = self.heights()
+        if full:
+            verts = vertex_view(self.geom_node).reshape(self.shape + (3,))
+            verts[..., 0] = self._grid_x
+            verts[..., 1] = heights
+            verts[..., 2] = self._grid_z
+            self._uploaded[:] = heights
+            self.rows_written = self.shape[0]
+            return
+
+        np.subtract(heights, self._uploaded, out=self._diff)
+        np.abs(self._diff, out=self._diff)
+        np.greater(self._diff, self.tolerance, out=self._changed)
+        rows = np.flatnonzero(self._changed.any(axis=1))
+        self.rows_written = 0
+        if not rows.size:
+            return
+        # Rows are contiguous in the vertex buffer, so each run of changed rows
+        # is one slice; rain changes scattered rows, and the gaps are skipped
+        verts = vertex_view(self.geom_node).reshape(self.shape + (3,))
+        breaks = np.flatnonzero(np.diff(rows) > 1) + 1
+        for run in np.split(rows, breaks):
+            r0, r1 = run[0], run[-1] + 1
+            verts[r0:r1, :, 1] = heights[r0:r1]
+            self._uploaded[r0:r1] = heights[r0:r1]
+        self.rows_written = rows.size
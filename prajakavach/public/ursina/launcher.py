@@ -0,0 +1,218 @@
+import argparse
+import json
+import multiprocessing as mp
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+
+from simulation.definitions import scenario_ids
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PORT = int(os.environ.get('LAUNCHER_PORT', 8765))
+SCENARIOS = tuple(scenario_ids())  # every definition in scenarios/
+
+
+class PoolBusy(Exception):
+    pass
+
+
+# --- Worker process ---
+def _worker(conn):
+    # Pay for the Ursina/Panda3D import and the scene modules before any request arrives.
+    from ursina import Ursina
+    from engine.scenes import SceneManager
+    from main_menu import DRILL_SCENES
+
+    conn.send(('ready', os.getpid()))
+    scenario = conn.recv()
+    if scenario is None:
+        return
+    app = Ursina()
+    SceneManager({scenario: DRILL_SCENES[scenario]}, home=scenario)
+
+    def acknowledge(task):
+        conn.send(('running', scenario))  # returning None ends the task after one run
+
+    # Acknowledge once the first frame has been drawn: the task runs inside
+    # app.run(), after Panda3D's render task (sort 50). invoke(..., delay=0)
+    # would call conn.send straight away, before any frame.
+    app.taskMgr.add(acknowledge, 'launcher-ack', sort=60)
+    app.run()
+
+
+class Worker:
+    def __init__(self, ctx):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker, args=(child,))
+        self.process.start()
+        child.close()
+        self.spawned = time.perf_counter()
+
+
+class WorkerPool:
+    # Keeps `size` interpreters idle with Ursina imported, never running more
+    # than `max_workers` processes in total. Requests beyond that wait in a
+    # bounded queue instead of starting new processes.
+    def __init__(self, size=2, max_workers=8, max_queue=16):
+        self.ctx = mp.get_context('spawn')
+        self.size = size
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.starting = []
+        self.idle = deque()
+        self.busy = []
+        self.waiting = 0
+        self.launches = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=500)
+        self.warmup = deque(maxlen=50)
+        self.cond = threading.Condition()
+        self.wake = threading.Event()
+        self.retry_at = 0.0
+        self.running = True
+        self.thread = threading.Thread(target=self._maintain, daemon=True)
+        self.thread.start()
+
+    def _maintain(self):
+        while self.running:
+            with self.cond:
+                for w in list(self.starting):
+                    if w.conn.poll():
+                        w.conn.recv()
+                        self.starting.remove(w)
+                        self.idle.append(w)
+                        self.warmup.append(time.perf_counter() - w.spawned)
+                        self.cond.notify_all()
+                    elif not w.process.is_alive():
+                        # Crashed during import; back off instead of respawning in a loop
+                        self.starting.remove(w)
+                        self.retry_at = time.perf_counter() + 5.0
+                self.busy = [w for w in self.busy if w.process.is_alive()]
+                for w in [w for w in self.idle if not w.process.is_alive()]:
+                    self.idle.remove(w)
+
+                warm = len(self.idle) + len(self.starting)
+                total = warm + len(self.busy)
+                while warm < self.size and total < self.max_workers and time.perf_counter() >= self.retry_at:
+                    self.starting.append(Worker(self.ctx))
+                    warm += 1
+                    total += 1
+            self.wake.wait(0.1)
+            self.wake.clear()
+
+    def launch(self, scenario, timeout=10.0):
+        start = time.perf_counter()
+        with self.cond:
+            if not self.idle and self.waiting >= self.max_queue:
+                self.rejected += 1
+                raise PoolBusy('launch queue is full')
+            self.waiting += 1
+            try:
+                ready = self.cond.wait_for(lambda: self.idle, timeout)
+            finally:
+                self.waiting -= 1
+            if not ready:
+                self.rejected += 1
+                raise PoolBusy('no idle worker became available')
+            worker = self.idle.popleft()
+            self.busy.append(worker)
+        self.wake.set()
+
+        worker.conn.send(scenario)
+        if not worker.conn.poll(timeout):
+            raise PoolBusy(f'worker {worker.process.pid} did not start {scenario}')
+        worker.conn.recv()
+        latency = time.perf_counter() - start
+        with self.cond:
+            self.launches += 1
+            self.latencies.append(latency)
+        return {'pid': worker.process.pid, 'latency_ms': round(latency * 1000, 1)}
+
+    def stats(self):
+        with self.cond:
+            latencies = sorted(self.latencies)
+            warmup = sorted(self.warmup)
+
+            def pct(values, q):
+                return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 1) if values else None
+
+            return {
+                'pool_size': self.size,
+                'max_workers': self.max_workers,
+                'idle': len(self.idle),
+                'starting': len(self.starting),
+                'busy': len(self.busy),
+                'queue_depth': self.waiting,
+                'max_queue': self.max_queue,
+                'launches': self.launches,
+                'rejected': self.rejected,
+                'launch_latency_ms': {'p50': pct(latencies, 0.5), 'p95': pct(latencies, 0.95),
+                                      'max': pct(latencies, 1.0)},
+                'worker_warmup_ms': {'p50': pct(warmup, 0.5), 'max': pct(warmup, 1.0)},
+            }
+
+    def close(self):
+        self.running = False
+        with self.cond:
+            for w in list(self.idle) + self.starting:
+                w.process.terminate()
+
+
+# --- Local control socket (one JSON object per line) ---
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get('cmd') == 'stats':
+                reply = {'ok': True, 'stats': self.server.pool.stats()}
+            elif request.get('cmd') == 'launch' and request.get('scenario') in SCENARIOS:
+                reply = {'ok': True, **self.server.pool.launch(request['scenario'], self.server.launch_timeout)}
+            else:
+                reply = {'ok': False, 'error': 'unknown command or scenario'}
+        except PoolBusy as e:
+            reply = {'ok': False, 'busy': True, 'error': str(e)}
+        except (ValueError, OSError, EOFError) as e:
+            reply = {'ok': False, 'error': str(e)}
+        self.wfile.write((json.dumps(reply) + '\n').encode())
+
+
+class LauncherServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, pool, launch_timeout):
+        super().__init__(address, Handler)
+        self.pool = pool
+        # Not socketserver's own `timeout`, which would change handle_request()
+        self.launch_timeout = launch_timeout
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep warm Ursina interpreters ready to start drills.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--pool-size', type=int, default=2, help='idle warm workers to keep')
+    parser.add_argument('--max-workers', type=int, default=8, help='cap on running game processes')
+    parser.add_argument('--max-queue', type=int, default=16, help='launch requests allowed to wait')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='seconds to wait for a worker to take a launch')
+    args = parser.parse_args()
+
+    # Workers resolve the scene modules relative to this folder
+    os.chdir(HERE)
+    pool = WorkerPool(args.pool_size, args.max_workers, args.max_queue)
+    server = LauncherServer((args.host, args.port), pool, args.timeout)
+    print(f'Launcher listening on {args.host}:{args.port} with {args.pool_size} warm workers')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import sys
+import time
+
+from simulation.replay import Recording, replay
+
+
+# Audit recorded drill attempts from replays/:
+#   python replay.py replays/floods-*.pkrp            re-run headless and check the outcome
+#   python replay.py replays/floods-....pkrp --render  watch it in the window
+def check(paths):
+    mismatches = 0
+    for path in paths:
+        recording = Recording.load(path)
+        start = time.perf_counter()
+        state = replay(recording)
+        elapsed = time.perf_counter() - start
+        simulated = recording.steps * recording.dt
+        ok = state.outcome == recording.outcome and state.score == recording.score
+        mismatches += not ok
+        print(f'{path}: {recording.scenario} seed {recording.seed}, {simulated:.1f}s -> '
+              f'{state.outcome} score {state.score} ({"matches" if ok else "MISMATCH, recorded " + str(recording.outcome)}), '
+              f'{simulated / max(elapsed, 1e-9):.0f}x real time')
+    return mismatches
+
+
+def render(path, speed):
+    from functools import partial
+    from ursina import Ursina, application
+    from engine.scenes import SceneManager
+    from main_menu import DRILL_SCENES
+
+    recording = Recording.load(path)
+    app = Ursina()
+    application.time_scale = speed
+    SceneManager({'replay': partial(DRILL_SCENES[recording.scenario], playback=recording)}, home='replay')
+    app.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded drill attempts.')
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--render', action='store_true', help='play the first file in the window')
+    parser.add_argument('--speed', type=float, default=1.0, help='playback speed when rendering')
+    args = parser.parse_args()
+    if args.render:
+        render(args.paths[0], args.speed)
+    elif check(args.paths):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
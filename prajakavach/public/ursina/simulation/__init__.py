@@ -0,0 +1,7 @@
+# Headless game rules for the drill scenarios. Nothing in this package imports
+# Ursina, so drills can be stepped on a server without a window or GPU.
+# Each scenario is a definition in scenarios/*.json run by simulation.scenario.
+from simulation import definitions
+from simulation.scenario import Scenario
+
+SCENARIOS = {definition['name']: Scenario(definition) for definition in definitions.load_all()}
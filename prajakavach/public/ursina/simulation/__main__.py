@@ -0,0 +1,40 @@
+import argparse
+import time
+from collections import Counter
+
+from simulation import SCENARIOS, definitions, mapgen
+from simulation.common import FIXED_DT, run_episode, seek
+from simulation.scenario import Scenario
+
+
+# Headless drill runner: python -m simulation floods --episodes 1000
+def main():
+    parser = argparse.ArgumentParser(description='Run drill episodes without a window.')
+    parser.add_argument('scenario', choices=sorted(SCENARIOS))
+    parser.add_argument('--episodes', type=int, default=1000)
+    parser.add_argument('--dt', type=float, default=FIXED_DT)
+    parser.add_argument('--grid-size', type=int, help='flood solver resolution for drills with a flood hazard')
+    args = parser.parse_args()
+
+    scenario = SCENARIOS[args.scenario]
+    mapgen.disk_cache = False  # one-off seeds; caching them would only fill maps/
+    if args.grid_size:
+        scenario = Scenario(definitions.get(args.scenario), {'flood': {'grid_size': args.grid_size}})
+    target = (scenario.goal_x, scenario.goal_y)
+
+    def policy(state):
+        return seek(state.player, *target)
+
+    outcomes = Counter()
+    start = time.perf_counter()
+    for seed in range(args.episodes):
+        outcomes[run_episode(scenario, policy, seed=seed, dt=args.dt).outcome] += 1
+    elapsed = time.perf_counter() - start
+
+    for outcome, n in outcomes.most_common():
+        print(f'{outcome}: {n}')
+    print(f'{args.episodes / elapsed:.0f} episodes/s')
+
+
+if __name__ == '__main__':
+    main()
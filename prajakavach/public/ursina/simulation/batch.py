@@ -0,0 +1,271 @@
+import argparse
+import itertools
+import json
+import math
+import sys
+import time
+
+import numpy as np
+
+from simulation import SCENARIOS, mapgen
+from simulation.common import FIXED_DT, START_X, START_Y, FixedStepper
+from simulation.scenario import DebrisHazard, FloodHazard, rise_rate
+
+# Outcome codes stored per agent
+RUNNING, SUCCESS, FAILED, TIMEOUT = 0, 1, 2, 3
+OUTCOME_NAMES = {SUCCESS: 'success', FAILED: 'failed', TIMEOUT: 'timeout'}
+
+# Player model shared by every scenario: how long a student takes to react,
+# how efficiently they steer, and how often they detour for a pickup.
+AGENT_DEFAULTS = {
+    'reaction_delay': 1.0,  # median seconds before moving (log-normal)
+    'efficiency': 0.8,  # mean fraction of full speed actually used
+    'detour_chance': 0.5,  # drought only: chance of heading for water first
+}
+
+# Defaults come from the scenario definitions; batch models exist for these four
+floods, earthquake, heatwave, drought = (SCENARIOS[name] for name in ('floods', 'earthquake', 'heatwave', 'drought'))
+_flood = next(h for h in floods.hazards if isinstance(h, FloodHazard))
+_debris = next(h for h in earthquake.hazards if isinstance(h, DebrisHazard))
+_sources = drought.definition['layout'][drought.pickups['group']]
+
+SCENARIO_DEFAULTS = {
+    'floods': {'duration': floods.timer_start, 'rise_base': _flood.rise_base,
+               'rise_accel': _flood.rise_accel, 'speed': floods.speed},
+    'earthquake': {'duration': earthquake.timer_start, 'hits': _debris.hits,
+                   'min_speed': _debris.min_speed, 'speed': earthquake.speed},
+    'heatwave': {'heat_resistance': heatwave.timer_start, 'drain_rate': heatwave.drain,
+                 'speed': heatwave.speed},
+    'drought': {'thirst_max': drought.timer_start, 'hydration': drought.pickups['restore'],
+                'sources': _sources['count'], 'speed': drought.speed},
+}
+
+
+class Agents:
+    # Struct-of-arrays state for N simulated players. Finished agents are
+    # compacted out so later steps only touch the ones still running.
+    def __init__(self, n, params, rng):
+        self.n = n
+        self.index = np.arange(n)
+        self.x = np.full(n, START_X)
+        self.y = np.full(n, START_Y)
+        self.delay = rng.lognormal(math.log(params['reaction_delay']), 0.5, n)
+        self.speed = params['speed'] * np.clip(rng.normal(params['efficiency'], 0.15, n), 0.2, 1.0)
+        self.outcome = np.full(n, RUNNING, dtype=np.int8)
+        self.margin = np.zeros(n)
+
+    def move(self, tx, ty, elapsed, dt):
+        # Mirrors seek(): each held axis key moves the full step distance.
+        step = np.where(elapsed >= self.delay, self.speed * dt, 0.0)
+        self.x += np.clip(tx - self.x, -step, step)
+        self.y = np.maximum(self.y + np.clip(ty - self.y, -step, step), START_Y)
+
+    def finish(self, mask, code, margin, *extra):
+        # Record outcomes for the masked agents and drop them from the arrays.
+        done = self.index[mask]
+        self.outcome[done] = code
+        self.margin[done] = margin[mask] if np.ndim(margin) else margin
+        keep = ~mask
+        self.index = self.index[keep]
+        self.x = self.x[keep]
+        self.y = self.y[keep]
+        self.delay = self.delay[keep]
+        self.speed = self.speed[keep]
+        return [a[keep] for a in extra]
+
+
+def _near(x, y, tx, ty, radius):
+    return (np.abs(x - tx) < radius) & (np.abs(y - ty) < radius)
+
+
+def _timed(agents, dt, limit, tx, ty, radius, drain=1.0, hazard=None):
+    # Shared loop for drills with one global timer and one target.
+    elapsed, remaining = 0.0, limit
+    while agents.index.size:
+        agents.move(tx, ty, elapsed, dt)
+        elapsed += dt
+        if hazard is not None:
+            agents.finish(hazard(remaining, dt, agents), FAILED, 0.0)
+        remaining -= dt * drain
+        agents.finish(_near(agents.x, agents.y, tx, ty, radius), SUCCESS, remaining)
+        if remaining <= 0:
+            agents.finish(np.ones(agents.index.size, dtype=bool), TIMEOUT, 0.0)
+    return agents
+
+
+def simulate_floods(agents, params, dt, rng):
+    # The game's flood: water spreads over a layout's heightmap in FloodGrid and
+    # an agent drowns when the local depth where they stand (on the ground at
+    # z = 0) reaches them. All agents share one layout, drawn from the seed.
+    # The grid always runs at the game's fixed step, whatever dt the agents use.
+    grid = floods.new_state(int(rng.integers(2 ** 32))).flood
+    area = grid.extent * grid.extent
+    stepper = FixedStepper(FIXED_DT, max_steps=sys.maxsize)
+    clock = [params['duration']]
+
+    def drowned(remaining, dt, agents):
+        for _ in range(stepper.advance(dt)):
+            rise = rise_rate(clock[0], params['duration'], params['rise_base'], params['rise_accel']) * FIXED_DT
+            grid.step(FIXED_DT, rise * area)
+            clock[0] -= FIXED_DT
+        return agents.y < grid.depths_at(agents.x, 0.0)
+
+    return _timed(agents, dt, params['duration'], floods.goal_x, floods.goal_y,
+                  floods.goal_radius, hazard=drowned)
+
+
+def simulate_earthquake(agents, params, dt, rng):
+    # The game's falling debris (DebrisBodies) with the layout drawn from the seed.
+    # Agents share one fall of debris, so bodies pass through them instead of
+    # bouncing off; each body can injure a given agent only once.
+    debris = earthquake.new_state(int(rng.integers(2 ** 32))).debris
+    stepper = FixedStepper(FIXED_DT, max_steps=sys.maxsize)
+    injuries = np.zeros(agents.n, dtype=np.int64)
+    struck = [np.empty(0, dtype=np.int64)]  # agent * debris.count + body, already counted
+
+    def injured(remaining, dt, agents):
+        order = np.argsort(agents.x, kind='stable')
+        for _ in range(stepper.advance(dt)):
+            debris.step(FIXED_DT)
+            player, body = debris.hits_players(agents.x, agents.y, params['min_speed'], order)
+            who = agents.index[player]
+            pairs = who * debris.count + body
+            new = ~np.isin(pairs, struck[0])
+            struck[0] = np.union1d(struck[0], pairs)
+            injuries[:] += np.bincount(who[new], minlength=agents.n)
+        return injuries[agents.index] >= params['hits']
+
+    return _timed(agents, dt, params['duration'], earthquake.goal_x, earthquake.goal_y,
+                  earthquake.goal_radius, hazard=injured)
+
+
+def simulate_heatwave(agents, params, dt, rng):
+    return _timed(agents, dt, params['heat_resistance'], heatwave.goal_x, heatwave.goal_y,
+                  heatwave.goal_radius, drain=params['drain_rate'])
+
+
+def simulate_drought(agents, params, dt, rng):
+    n, k = agents.n, int(params['sources'])
+    sources_x = rng.uniform(*_sources['x'], (n, k))
+    source_y, source_radius = _sources['y'][0], drought.pickups['radius']
+    active = np.ones((n, k), dtype=bool)
+    thirst = np.full(n, params['thirst_max'])
+    # Detouring agents walk to the closest source first, then to the oasis.
+    detour = rng.random(n) < params['detour_chance']
+    if k:
+        first = np.abs(sources_x - START_X).argmin(axis=1)
+        detour_x = sources_x[np.arange(n), first]
+    else:
+        first, detour_x = np.zeros(n, dtype=int), np.zeros(n)
+        detour[:] = False
+
+    elapsed = 0.0
+    while agents.index.size:
+        tx = np.where(detour, detour_x, drought.goal_x)
+        ty = np.where(detour, source_y, drought.goal_y)
+        agents.move(tx, ty, elapsed, dt)
+        elapsed += dt
+        thirst -= dt
+
+        for j in range(k):
+            hit = active[:, j] & _near(agents.x, agents.y, sources_x[:, j], source_y, source_radius)
+            thirst = np.where(hit, np.minimum(thirst + params['hydration'], params['thirst_max']),
+                              thirst)
+            active[:, j] &= ~hit
+            detour &= ~(hit & (j == first))
+
+        done = _near(agents.x, agents.y, drought.goal_x, drought.goal_y, drought.goal_radius)
+        sources_x, active, thirst, detour, detour_x, first = agents.finish(
+            done, SUCCESS, thirst, sources_x, active, thirst, detour, detour_x, first)
+        sources_x, active, thirst, detour, detour_x, first = agents.finish(
+            thirst <= 0, FAILED, 0.0, sources_x, active, thirst, detour, detour_x, first)
+    return agents
+
+
+SIMULATORS = {
+    'floods': simulate_floods,
+    'earthquake': simulate_earthquake,
+    'heatwave': simulate_heatwave,
+    'drought': simulate_drought,
+}
+
+
+def run(scenario, n, params=None, dt=0.05, seed=None, cohort_size=30):
+    full = dict(AGENT_DEFAULTS, **SCENARIO_DEFAULTS[scenario])
+    full.update(params or {})
+    rng = np.random.default_rng(seed)
+    agents = SIMULATORS[scenario](Agents(n, full, rng), full, dt, rng)
+    return summarize(agents.outcome, agents.margin, cohort_size, full)
+
+
+def summarize(outcome, margin, cohort_size, params):
+    n = outcome.size
+    survived = outcome == SUCCESS
+    rate = survived.mean()
+    # Wilson score interval for the survival rate
+    z = 1.96
+    centre = (rate + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    # Per-class survival: how much a teacher should expect results to vary
+    cohorts = n // cohort_size
+    cohort_rates = survived[:cohorts * cohort_size].reshape(cohorts, cohort_size).mean(axis=1) \
+        if cohorts else np.array([rate])
+    left = margin[survived]
+    return {
+        'params': params,
+        'agents': n,
+        'survival_rate': float(rate),
+        'survival_ci95': [float(centre - half), float(centre + half)],
+        'outcomes': {name: int((outcome == code).sum()) for code, name in OUTCOME_NAMES.items()},
+        'cohort_survival_p10_p50_p90': [float(q) for q in np.percentile(cohort_rates, [10, 50, 90])],
+        'margin_p10_p50_p90': [float(q) for q in np.percentile(left, [10, 50, 90])] if left.size else None,
+    }
+
+
+def _parse_sweep(items):
+    sweep = {}
+    for item in items:
+        key, _, values = item.partition('=')
+        sweep[key] = [float(v) for v in values.split(',')]
+    return sweep
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo survival rates for a drill.')
+    parser.add_argument('scenario', choices=sorted(SIMULATORS))
+    parser.add_argument('--agents', type=int, default=100000)
+    parser.add_argument('--dt', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--cohort-size', type=int, default=30)
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=V1,V2',
+                        help='parameter values to sweep, e.g. --set rise_accel=0.05,0.1,0.2')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+    mapgen.disk_cache = False  # one-off flood layouts; caching them would only fill maps/
+
+    sweep = _parse_sweep(args.set)
+    known = set(AGENT_DEFAULTS) | set(SCENARIO_DEFAULTS[args.scenario])
+    unknown = set(sweep) - known
+    if unknown:
+        parser.error(f"unknown parameter(s) {', '.join(sorted(unknown))}; choose from {', '.join(sorted(known))}")
+
+    results = []
+    for values in itertools.product(*sweep.values()):
+        params = dict(zip(sweep, values))
+        start = time.perf_counter()
+        result = run(args.scenario, args.agents, params, args.dt, args.seed, args.cohort_size)
+        result['seconds'] = time.perf_counter() - start
+        results.append(result)
+        if not args.json:
+            setting = ', '.join(f'{k}={v:g}' for k, v in params.items()) or 'defaults'
+            low, high = result['survival_ci95']
+            p10, p50, p90 = result['cohort_survival_p10_p50_p90']
+            print(f"{setting}: survival {result['survival_rate']:.1%} ({low:.1%}-{high:.1%}), "
+                  f"per-class p10/p50/p90 {p10:.0%}/{p50:.0%}/{p90:.0%}, "
+                  f"{result['outcomes']} [{result['seconds']:.2f}s]")
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from math import hypot
+
+FIXED_DT = 1 / 60
+# Every way an attempt can fail. Replay and telemetry files store the index,
+# so only ever append; scenarios/schema.json lists the same names.
+FAILURES = ('drowned', 'timeout', 'exhausted', 'dehydrated', 'injured')
+MAX_CATCH_UP = 10  # steps per frame, i.e. a 6 fps floor before the simulation slows down
+
+# Character start position and ground limits (body centre; head sits 0.8 above)
+START_X = -8.0
+START_Y = 0.5
+HEAD_OFFSET = 0.8
+
+
+@dataclass
+class Inputs:
+    up: bool = False
+    down: bool = False
+    left: bool = False
+    right: bool = False
+
+    @classmethod
+    def from_keys(cls, keys):
+        return cls(bool(keys['w']), bool(keys['s']), bool(keys['a']), bool(keys['d']))
+
+
+NO_INPUT = Inputs()
+
+
+@dataclass
+class Player:
+    x: float = START_X
+    y: float = START_Y
+
+    @property
+    def head_y(self):
+        return self.y + HEAD_OFFSET
+
+    def move(self, inputs, distance):
+        if inputs.up:
+            self.y += distance
+        if inputs.down:
+            self.y -= distance
+        if inputs.left:
+            self.x -= distance
+        if inputs.right:
+            self.x += distance
+        # Prevent going under the ground
+        self.y = max(self.y, START_Y)
+
+
+def near(ax, ay, bx, by, radius):
+    return abs(ax - bx) < radius and abs(ay - by) < radius
+
+
+def distance(ax, ay, bx, by):
+    return hypot(ax - bx, ay - by)
+
+
+def seek(player, target_x, target_y, deadzone=0.05):
+    # Simple scripted policy: hold the keys that point at the target.
+    dx = target_x - player.x
+    dy = target_y - player.y
+    return Inputs(up=dy > deadzone, down=dy < -deadzone, left=dx < -deadzone, right=dx > deadzone)
+
+
+class FixedStepper:
+    # Turns variable frame times into a whole number of fixed simulation steps.
+    # After a stall (loading, a dragged window) at most max_steps run in one
+    # frame and the rest of the backlog is dropped, so a slow machine falls
+    # behind real time instead of spiralling into ever longer frames.
+    def __init__(self, dt=FIXED_DT, max_steps=MAX_CATCH_UP):
+        self.dt = dt
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped = 0  # steps skipped by the catch-up limit
+
+    def advance(self, frame_dt):
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+        return steps
+
+    @property
+    def alpha(self):
+        # How far real time is into the next step, for interpolating what is drawn
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self):
+        self.accumulator = 0.0
+
+
+def run_episode(scenario, policy, seed=None, dt=FIXED_DT, max_time=600.0):
+    state = scenario.new_state(seed)
+    steps = int(max_time / dt)
+    for _ in range(steps):
+        if state.outcome is not None:
+            break
+        scenario.step(state, policy(state), dt)
+    return state
@@ -0,0 +1,340 @@
+import argparse
+import json
+import math
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from simulation import SCENARIOS, definitions, mapgen
+from simulation.navigation import FlowField, NavGrid
+
+# Social-force steering (Helbing-style) on the ground plane, x and z in metres
+RELAX_TIME = 0.5  # seconds to reach the preferred velocity
+REPULSION = 2.0  # strength of the push between nearby agents
+REPULSION_RANGE = 0.3  # how quickly that push falls off with distance
+CONTACT = 12.0  # extra push once bodies overlap
+NEIGHBOUR_RADIUS = 1.2  # agents further apart than this ignore each other
+WALL_RANGE = 0.4
+CONGESTION_SPEED = 0.3  # moving slower than this share of preferred speed counts as congested
+HOTSPOT_CELL = 2.0
+AGENT_RADIUS = 0.25
+FIELD_ENTRIES = 8  # baked flow fields kept per process, one per layout
+
+
+def neighbour_pairs(points, cell):
+    # Spatial hash: bucket agents by cell, then pair each agent with everyone
+    # in the 3x3 cells around it. Returns each unordered pair (i < j) once.
+    n = len(points)
+    cells = np.floor(points / cell).astype(np.int64)
+    keys = cells[:, 0] * 1_000_003 + cells[:, 1]
+    order = np.argsort(keys, kind='stable')
+    unique, start, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    agents = np.arange(n)
+
+    pairs_i, pairs_j = [], []
+    for dx in (-1, 0, 1):
+        for dz in (-1, 0, 1):
+            target = keys + dx * 1_000_003 + dz
+            slot = np.minimum(np.searchsorted(unique, target), len(unique) - 1)
+            found = unique[slot] == target
+            if not found.any():
+                continue
+            count = counts[slot[found]]
+            first = np.repeat(start[slot[found]], count)
+            within = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+            pairs_i.append(np.repeat(agents[found], count))
+            pairs_j.append(order[first + within])
+    i = np.concatenate(pairs_i)
+    j = np.concatenate(pairs_j)
+    keep = i < j
+    return i[keep], j[keep]
+
+
+class Crowd:
+    # Struct-of-arrays crowd walking to the nearest exit. Evacuated agents are
+    # compacted out, so each step only touches the ones still inside.
+    def __init__(self, count, exits, spawn_x, spawn_z, obstacles=(), speed=(1.0, 1.6), radius=AGENT_RADIUS,
+                 extent=100.0, seed=0, field=None):
+        rng = np.random.default_rng(seed)
+        self.seed = seed
+        self.count = count
+        self.exits = np.asarray(exits, dtype=np.float64).reshape(-1, 3)  # x, z, radius
+        self.obstacles = np.asarray(obstacles, dtype=np.float64).reshape(-1, 4)  # cx, cz, half_x, half_z
+        self.extent = extent
+        self.radius = radius
+        self.field = field  # FlowField to the exits; without one agents head straight for them
+        self.time = 0.0
+
+        self.pos = np.column_stack([rng.uniform(*spawn_x, count), rng.uniform(*spawn_z, count)])
+        for _ in range(20):
+            inside = self._inside_obstacle(self.pos)
+            if not inside.any():
+                break
+            self.pos[inside] = np.column_stack([rng.uniform(*spawn_x, inside.sum()),
+                                                rng.uniform(*spawn_z, inside.sum())])
+        self.vel = np.zeros((count, 2))
+        self.speed = rng.uniform(*speed, count)
+        self.index = np.arange(count)  # ids of agents still inside
+
+        self.exit_time = np.full(count, np.nan)
+        self.exit_used = np.full(count, -1, dtype=np.int64)
+        cells = int(math.ceil(extent / HOTSPOT_CELL))
+        self.congestion = np.zeros((cells, cells))  # agent-seconds spent crawling, per cell
+        # Positions of every agent (evacuated ones keep their exit position) for rendering
+        self.positions = self.pos.copy()
+
+    @property
+    def remaining(self):
+        return self.index.size
+
+    def _inside_obstacle(self, p):
+        if not len(self.obstacles):
+            return np.zeros(len(p), dtype=bool)
+        c, h = self.obstacles[:, :2], self.obstacles[:, 2:]
+        return (np.abs(p[:, None, :] - c[None]) < h[None]).all(axis=2).any(axis=1)
+
+    def _preferred_velocity(self, p, speed):
+        # Follow the flow field; straight towards the nearest exit where it has no answer
+        # (at the exit itself, or standing somewhere it cannot route from)
+        offset = self.exits[None, :, :2] - p[:, None, :]
+        dist = np.hypot(offset[..., 0], offset[..., 1])
+        nearest = dist.argmin(axis=1)
+        rows = np.arange(len(p))
+        direction = offset[rows, nearest] / np.maximum(dist[rows, nearest], 1e-6)[:, None]
+        if self.field is not None:
+            routed = self.field.directions_at(p)
+            known = routed.any(axis=1)
+            direction[known] = routed[known]
+        return direction * speed[:, None]
+
+    def replan(self, flood=None, budget=None):
+        # Re-route around water that got too deep (and anything newly blocked);
+        # with a budget the field may need settle() calls to finish
+        if self.field is None:
+            return 0
+        if flood is not None:
+            self.field.grid.update_flood(flood)
+        return self.field.refresh(budget)
+
+    def settle(self, budget=None):
+        if self.field is not None:
+            self.field.settle(budget)
+
+    def _agent_forces(self, p):
+        force = np.zeros_like(p)
+        if len(p) < 2:
+            return force
+        i, j = neighbour_pairs(p, NEIGHBOUR_RADIUS)
+        d = p[i] - p[j]
+        dist = np.hypot(d[:, 0], d[:, 1])
+        close = dist < NEIGHBOUR_RADIUS
+        i, j, d, dist = i[close], j[close], d[close], np.maximum(dist[close], 1e-6)
+        gap = 2 * self.radius - dist
+        magnitude = REPULSION * np.exp(gap / REPULSION_RANGE) + CONTACT * np.maximum(gap, 0.0)
+        push = d * (magnitude / dist)[:, None]
+        n = len(p)
+        for axis in (0, 1):
+            force[:, axis] += np.bincount(i, push[:, axis], n) - np.bincount(j, push[:, axis], n)
+        return force
+
+    def _wall_forces(self, p):
+        force = np.zeros_like(p)
+        for cx, cz, hx, hz in self.obstacles:
+            nearest = np.column_stack([np.clip(p[:, 0], cx - hx, cx + hx), np.clip(p[:, 1], cz - hz, cz + hz)])
+            d = p - nearest
+            dist = np.hypot(d[:, 0], d[:, 1])
+            near = (dist > 1e-9) & (dist < self.radius + WALL_RANGE)
+            if near.any():
+                gap = self.radius - dist[near]
+                magnitude = REPULSION * np.exp(gap / REPULSION_RANGE) + CONTACT * np.maximum(gap, 0.0)
+                force[near] += d[near] * (magnitude / dist[near])[:, None]
+        return force
+
+    def _push_out(self, p):
+        # Nobody walks through a wall: anyone inside a box goes out through its nearest face
+        r = self.radius
+        for cx, cz, hx, hz in self.obstacles:
+            inside = (np.abs(p[:, 0] - cx) < hx + r) & (np.abs(p[:, 1] - cz) < hz + r)
+            if not inside.any():
+                continue
+            q = p[inside]
+            out_x = np.where(q[:, 0] > cx, cx + hx + r, cx - hx - r)
+            out_z = np.where(q[:, 1] > cz, cz + hz + r, cz - hz - r)
+            use_x = np.abs(out_x - q[:, 0]) < np.abs(out_z - q[:, 1])
+            q[use_x, 0] = out_x[use_x]
+            q[~use_x, 1] = out_z[~use_x]
+            p[inside] = q
+
+    def step(self, dt):
+        if not self.index.size:
+            return
+        p, v, speed = self.pos, self.vel, self.speed
+        preferred = self._preferred_velocity(p, speed)
+        force = (preferred - v) / RELAX_TIME + self._agent_forces(p) + self._wall_forces(p)
+        v += force * dt
+        # Nobody outruns 1.3x their preferred speed, however hard they are pushed
+        current = np.hypot(v[:, 0], v[:, 1])
+        limit = 1.3 * speed
+        too_fast = current > limit
+        v[too_fast] *= (limit[too_fast] / current[too_fast])[:, None]
+        p += v * dt
+        self._push_out(p)
+        half = self.extent / 2
+        np.clip(p, -half, half, out=p)
+        self.time += dt
+
+        # Congestion: time spent well below preferred speed, binned on a coarse grid
+        slow = np.hypot(v[:, 0], v[:, 1]) < CONGESTION_SPEED * speed
+        if slow.any():
+            cells = ((p[slow] + half) / HOTSPOT_CELL).astype(np.int64)
+            np.clip(cells, 0, self.congestion.shape[0] - 1, out=cells)
+            np.add.at(self.congestion, (cells[:, 1], cells[:, 0]), dt)
+
+        self.positions[self.index] = p
+        offset = p[:, None, :] - self.exits[None, :, :2]
+        inside = np.hypot(offset[..., 0], offset[..., 1]) < self.exits[None, :, 2]
+        out = inside.any(axis=1)
+        if out.any():
+            done = self.index[out]
+            self.exit_time[done] = self.time
+            self.exit_used[done] = inside[out].argmax(axis=1)
+            keep = ~out
+            self.index = self.index[keep]
+            self.pos, self.vel, self.speed = p[keep], v[keep], speed[keep]
+
+    def report(self, hotspots=5):
+        left = ~np.isnan(self.exit_time)
+        times = self.exit_time[left]
+        exits = []
+        for e, (x, z, radius) in enumerate(self.exits):
+            used = np.sort(self.exit_time[self.exit_used == e])
+            span = used[-1] - used[0] if used.size > 1 else 0.0
+            exits.append({
+                'x': float(x), 'z': float(z), 'agents': int(used.size),
+                'first_s': float(used[0]) if used.size else None,
+                'last_s': float(used[-1]) if used.size else None,
+                'throughput_per_s': float((used.size - 1) / span) if span > 0 else None,
+            })
+        half = self.extent / 2
+        flat = np.argsort(self.congestion, axis=None)[::-1][:hotspots]
+        spots = []
+        for row, col in zip(*np.unravel_index(flat, self.congestion.shape)):
+            if self.congestion[row, col] <= 0:
+                break
+            spots.append({'x': float((col + 0.5) * HOTSPOT_CELL - half), 'z': float((row + 0.5) * HOTSPOT_CELL - half),
+                          'agent_seconds': float(self.congestion[row, col])})
+        return {
+            'agents': self.count,
+            'evacuated': int(left.sum()),
+            'evacuation_time_s': float(times.max()) if left.all() and times.size else None,
+            'time_p50_p90_p95_s': [float(q) for q in np.percentile(times, [50, 90, 95])] if times.size else None,
+            'exits': exits,
+            'hotspots': spots,
+        }
+
+
+def obstacles_for(definition, layout):
+    # Scenery groups and structures become boxes, except structures that hold an exit (doors)
+    boxes = []
+    for group in definition.get('scenery', []):
+        sx, _, sz = group['scale']
+        for x, y, z, size, speed in layout[group['group']].tolist():
+            boxes.append((x, z, sx / 2, sz / 2))
+    exits = definition['crowd']['exits']
+    for s in definition.get('structures', []):
+        x, _, z = s['position']
+        sx, _, sz = s['scale']
+        if not any(abs(e['x'] - x) <= sx / 2 and abs(e['z'] - z) <= sz / 2 for e in exits):
+            boxes.append((x, z, sx / 2, sz / 2))
+    return boxes
+
+
+_fields = OrderedDict()
+
+
+def _baked_field(obstacles, extent, exits, cell):
+    # Baking the field is by far the slowest part of setting up a crowd, and a
+    # restarted drill has the same layout, so keep the bake and hand out copies
+    key = (extent, cell, tuple(exits), tuple(obstacles))
+    field = _fields.get(key)
+    if field is None:
+        grid = NavGrid(extent, cell)
+        for box in obstacles:
+            grid.add_box(*box, pad=AGENT_RADIUS)
+        field = _fields[key] = FlowField(grid, exits)
+        if len(_fields) > FIELD_ENTRIES:
+            _fields.popitem(last=False)
+    else:
+        _fields.move_to_end(key)
+    return field.copy()
+
+
+def from_definition(definition, seed=0, count=None, cell=0.5):
+    spec = definition['crowd']
+    layout = mapgen.generate(definition['name'], seed)
+    extent = layout.config.get('terrain', {}).get('extent', 100.0)
+    exits = [(e['x'], e['z'], e['radius']) for e in spec['exits']]
+    obstacles = obstacles_for(definition, layout)
+    return Crowd(
+        count or spec['agents'],
+        exits,
+        spec['spawn']['x'], spec['spawn']['z'],
+        obstacles,
+        speed=spec.get('speed', (1.0, 1.6)),
+        radius=AGENT_RADIUS,
+        extent=extent,
+        seed=seed,
+        field=_baked_field(obstacles, extent, exits, cell),
+    )
+
+
+def run(crowd, dt=0.05, max_time=600.0, scenario=None, replan_every=1.0):
+    # With a scenario its hazards advance alongside, and the crowd re-plans around the water
+    state = scenario.new_state(crowd.seed) if scenario is not None else None
+    next_plan = 0.0
+    while crowd.remaining and crowd.time < max_time:
+        if state is not None:
+            scenario.advance(state, dt)
+            if crowd.time >= next_plan:
+                crowd.replan(state.flood)
+                next_plan += replan_every
+        crowd.step(dt)
+    return crowd.report()
+
+
+def main():
+    # python -m simulation.crowd earthquake --agents 2000
+    names = [d['name'] for d in definitions.load_all() if 'crowd' in d]
+    parser = argparse.ArgumentParser(description='Evacuate a crowd of students to the exits without a window.')
+    parser.add_argument('scenario', choices=names)
+    parser.add_argument('--agents', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dt', type=float, default=0.05)
+    parser.add_argument('--max-time', type=float, default=600.0)
+    parser.add_argument('--hazards', action='store_true', help="run the drill's hazards too (rising flood water)")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    crowd = from_definition(definitions.get(args.scenario), args.seed, args.agents)
+    start = time.perf_counter()
+    report = run(crowd, args.dt, args.max_time, SCENARIOS[args.scenario] if args.hazards else None)
+    report['wall_s'] = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    total = report['evacuation_time_s']
+    print(f"{report['evacuated']}/{report['agents']} evacuated"
+          + (f' in {total:.1f}s' if total is not None else f' after {crowd.time:.0f}s (time limit)')
+          + f" [{report['wall_s']:.2f}s wall]")
+    if report['time_p50_p90_p95_s']:
+        print('p50/p90/p95 exit time: ' + '/'.join(f'{t:.1f}s' for t in report['time_p50_p90_p95_s']))
+    for e in report['exits']:
+        rate = f"{e['throughput_per_s']:.2f}/s" if e['throughput_per_s'] else '-'
+        print(f"exit ({e['x']:g}, {e['z']:g}): {e['agents']} agents, {rate}")
+    for h in report['hotspots']:
+        print(f"congestion at ({h['x']:g}, {h['z']:g}): {h['agent_seconds']:.0f} agent-seconds")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+import numpy as np
+
+GRAVITY = 9.81
+
+# Player hit box around (x, y): body centre y, head on top, walking at z = 0
+PLAYER_HALF_X = 0.25
+PLAYER_BELOW = 0.5
+PLAYER_ABOVE = 1.0
+PLAYER_HALF_Z = 0.25
+
+
+class DebrisBodies:
+    # Falling debris as spheres held in NumPy arrays. Each body waits for its
+    # release time, falls under gravity, bounces off the ground and static
+    # boxes (structures), and goes to sleep once it has rested for a few steps.
+    # Only awake bodies are integrated, so settled debris costs nothing.
+    def __init__(self, points, boxes=(), release=None, floor=0.05, restitution=0.3, friction=0.4,
+                 sleep_speed=0.15, sleep_steps=10, cell=2.0):
+        points = np.asarray(points, dtype=np.float64)
+        n = len(points)
+        self.count = n
+        self.pos = points[:, :3].copy()
+        self.radius = points[:, 3] / 2  # layout size is the piece's diameter
+        self.vel = np.zeros((n, 3))
+        self.vel[:, 1] = -points[:, 4]
+        self.release = np.zeros(n) if release is None else np.asarray(release, dtype=np.float64)
+        self.floor = floor
+        self.restitution = restitution
+        self.friction = friction
+        self.sleep_speed = sleep_speed
+        self.sleep_steps = sleep_steps
+        self.time = 0.0
+
+        self.waiting = np.argsort(self.release, kind='stable')  # not yet released, by release time
+        self.awake = np.empty(0, dtype=np.int64)
+        self.resting = np.zeros(n, dtype=np.int32)
+        self.spent = np.zeros(n, dtype=bool)  # already hit the player once
+        self.moved = False  # any body moved since the caller last looked
+
+        # --- Grid broadphase over x/z: each cell lists up to `slots` boxes overlapping it ---
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)  # cx, cy, cz, hx, hy, hz
+        self.cell = cell
+        if len(self.boxes):
+            lo = self.boxes[:, [0, 2]] - self.boxes[:, [3, 5]]
+            hi = self.boxes[:, [0, 2]] + self.boxes[:, [3, 5]]
+            self.origin = lo.min(axis=0) - cell
+            first = np.floor((lo - self.origin) / cell).astype(np.int64)
+            last = np.floor((hi - self.origin) / cell).astype(np.int64)
+            shape = last.max(axis=0) + 2
+            per_cell = np.zeros(shape, dtype=np.int64)
+            entries = []
+            for b, ((x0, z0), (x1, z1)) in enumerate(zip(first, last)):
+                for cx in range(x0, x1 + 1):
+                    for cz in range(z0, z1 + 1):
+                        entries.append((cx, cz, per_cell[cx, cz], b))
+                        per_cell[cx, cz] += 1
+            self.table = np.full((shape[0], shape[1], max(1, per_cell.max())), -1, dtype=np.int64)
+            for cx, cz, slot, b in entries:
+                self.table[cx, cz, slot] = b
+
+    @property
+    def sleeping(self):
+        return self.count - len(self.waiting) - len(self.awake)
+
+    def step(self, dt):
+        self.time += dt
+        # Wake bodies whose release time has come
+        due = np.searchsorted(self.release[self.waiting], self.time, side='right')
+        if due:
+            self.awake = np.concatenate([self.awake, self.waiting[:due]])
+            self.waiting = self.waiting[due:]
+        if not len(self.awake):
+            return
+
+        i = self.awake
+        p, v, r = self.pos[i], self.vel[i], self.radius[i]
+        v[:, 1] -= GRAVITY * dt
+        p += v * dt
+        contact = np.zeros(len(i), dtype=bool)
+
+        # Ground
+        below = p[:, 1] < self.floor + r
+        if below.any():
+            p[below, 1] = self.floor + r[below]
+            v[below, 1] = np.maximum(-v[below, 1] * self.restitution, 0.0)
+            v[np.ix_(below, [0, 2])] *= 1.0 - self.friction
+            contact |= below
+
+        if len(self.boxes):
+            contact |= self._collide_boxes(p, v, r)
+
+        # Sleep after resting for sleep_steps in a row
+        speed = np.sqrt((v * v).sum(axis=1))
+        rest = contact & (speed < self.sleep_speed)
+        counter = np.where(rest, self.resting[i] + 1, 0)
+        self.resting[i] = counter
+        self.pos[i], self.vel[i] = p, v
+        asleep = counter >= self.sleep_steps
+        if asleep.any():
+            self.vel[i[asleep]] = 0.0
+            self.awake = i[~asleep]
+        self.moved = True
+
+    def _collide_boxes(self, p, v, r):
+        cells = np.floor((p[:, [0, 2]] - self.origin) / self.cell).astype(np.int64)
+        inside_grid = ((cells >= 0) & (cells < self.table.shape[:2])).all(axis=1)
+        contact = np.zeros(len(p), dtype=bool)
+        rows = np.nonzero(inside_grid)[0]
+        if not len(rows):
+            return contact
+        candidates = self.table[cells[rows, 0], cells[rows, 1]]
+        for slot in range(candidates.shape[1]):
+            box = candidates[:, slot]
+            hit = rows[box >= 0]
+            if not len(hit):
+                continue
+            b = self.boxes[box[box >= 0]]
+            centre, half = b[:, :3], b[:, 3:]
+            q = np.clip(p[hit], centre - half, centre + half)
+            d = p[hit] - q
+            dist = np.sqrt((d * d).sum(axis=1))
+            touching = dist < r[hit]
+            if not touching.any():
+                continue
+            hit, q, d, dist = hit[touching], q[touching], d[touching], dist[touching]
+            # A centre inside the box lands on the roof
+            inside = dist < 1e-9
+            d[inside] = (0.0, 1.0, 0.0)
+            q[inside, 1] = (b[touching][inside, 1] + b[touching][inside, 4])
+            dist[inside] = 1.0
+            normal = d / dist[:, None]
+            p[hit] = q + normal * r[hit][:, None]
+            vn = (v[hit] * normal).sum(axis=1)
+            approaching = vn < 0
+            v[hit] -= ((1.0 + self.restitution) * np.minimum(vn, 0.0))[:, None] * normal
+            v[hit] *= np.where(approaching, 1.0 - self.friction, 1.0)[:, None]
+            contact[hit] = True
+        return contact
+
+    def hit_player(self, x, y, min_speed=3.0):
+        # Awake bodies moving at least min_speed that touch the player's hit box.
+        # Each body can hurt only once; it then bounces off.
+        i = self.awake
+        if not len(i):
+            return 0
+        i = i[~self.spent[i]]
+        p, r = self.pos[i], self.radius[i]
+        near = ((np.abs(p[:, 0] - x) < PLAYER_HALF_X + r)
+                & (p[:, 1] > y - PLAYER_BELOW - r) & (p[:, 1] < y + PLAYER_ABOVE + r)
+                & (np.abs(p[:, 2]) < PLAYER_HALF_Z + r))
+        if not near.any():
+            return 0
+        i = i[near]
+        v = self.vel[i]
+        hits = i[(v * v).sum(axis=1) >= min_speed * min_speed]
+        self.vel[hits] *= -self.restitution
+        self.spent[hits] = True
+        return len(hits)
+
+    def hits_players(self, x, y, min_speed=3.0, order=None):
+        # hit_player for many players sharing one fall of debris (the batch runner):
+        # returns (player, body) index pairs. Nothing is spent or bounced here, so
+        # the caller decides how often a body may hurt the same player. Pass
+        # order = np.argsort(x) when calling again for players that have not moved.
+        i = self.awake
+        v = self.vel[i]
+        i = i[(v * v).sum(axis=1) >= min_speed * min_speed]
+        i = i[np.abs(self.pos[i, 2]) < PLAYER_HALF_Z + self.radius[i]]
+        if not len(i):
+            return np.empty(0, dtype=np.int64), i
+        p, r = self.pos[i], self.radius[i]
+        # Players sorted by x: each body reaches one contiguous slice of them
+        if order is None:
+            order = np.argsort(x, kind='stable')
+        xs = x[order]
+        lo = np.searchsorted(xs, p[:, 0] - PLAYER_HALF_X - r, side='right')
+        hi = np.searchsorted(xs, p[:, 0] + PLAYER_HALF_X + r, side='left')
+        counts = np.maximum(hi - lo, 0)
+        body = np.repeat(np.arange(len(i)), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        player = order[np.repeat(lo, counts) + offset]
+        py, by, br = y[player], p[body, 1], r[body]
+        level = (by > py - PLAYER_BELOW - br) & (by < py + PLAYER_ABOVE + br)
+        return player[level], i[body[level]]
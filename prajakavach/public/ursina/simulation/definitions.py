@@ -0,0 +1,217 @@
+import glob
+import json
+import math
+import os
+import re
+from functools import lru_cache
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(HERE, 'scenarios')
+SCHEMA_FILE = 'schema.json'
+
+
+class DefinitionError(ValueError):
+    pass
+
+
+# --- Schema checking: the subset of JSON Schema that scenarios/schema.json uses ---
+_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'boolean': bool,
+    'integer': int,
+    'number': (int, float),
+}
+
+
+def _is_type(value, name):
+    if isinstance(value, bool) and name != 'boolean':
+        return False
+    return isinstance(value, _TYPES[name])
+
+
+def validate(value, schema, root=None, path='$'):
+    root = root if root is not None else schema
+    if '$ref' in schema:
+        target = root
+        for part in schema['$ref'].lstrip('#/').split('/'):
+            target = target[part]
+        return validate(value, target, root, path)
+
+    for part in schema.get('allOf', ()):
+        validate(value, part, root, path)
+    if 'if' in schema:
+        try:
+            validate(value, schema['if'], root, path)
+        except DefinitionError:
+            branch = schema.get('else')
+        else:
+            branch = schema.get('then')
+        if branch is not None:
+            validate(value, branch, root, path)
+
+    types = schema.get('type')
+    if types is not None:
+        types = [types] if isinstance(types, str) else types
+        if not any(_is_type(value, t) for t in types):
+            raise DefinitionError(f'{path}: expected {" or ".join(types)}, got {json.dumps(value)}')
+    if 'const' in schema and value != schema['const']:
+        raise DefinitionError(f'{path}: must be {json.dumps(schema["const"])}')
+    if 'enum' in schema and value not in schema['enum']:
+        raise DefinitionError(f'{path}: {json.dumps(value)} is not one of {", ".join(map(str, schema["enum"]))}')
+    if 'pattern' in schema and isinstance(value, str) and not re.fullmatch(schema['pattern'], value):
+        raise DefinitionError(f'{path}: {value!r} does not match {schema["pattern"]}')
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if 'minimum' in schema and value < schema['minimum']:
+            raise DefinitionError(f'{path}: must be at least {schema["minimum"]}')
+        if 'maximum' in schema and value > schema['maximum']:
+            raise DefinitionError(f'{path}: must be at most {schema["maximum"]}')
+        if 'exclusiveMinimum' in schema and value <= schema['exclusiveMinimum']:
+            raise DefinitionError(f'{path}: must be greater than {schema["exclusiveMinimum"]}')
+
+    if isinstance(value, list):
+        if len(value) < schema.get('minItems', 0) or len(value) > schema.get('maxItems', len(value)):
+            raise DefinitionError(f'{path}: wrong number of items ({len(value)})')
+        if 'items' in schema:
+            for i, item in enumerate(value):
+                validate(item, schema['items'], root, f'{path}[{i}]')
+        # Not JSON Schema: a [low, high] range must not be reversed
+        if schema.get('ordered') and all(_is_type(v, 'number') for v in value) and value != sorted(value):
+            raise DefinitionError(f'{path}: {json.dumps(value)} must be in increasing order')
+
+    if isinstance(value, dict):
+        for key in schema.get('required', ()):
+            if key not in value:
+                raise DefinitionError(f'{path}: missing required field {key!r}')
+        properties = schema.get('properties', {})
+        extra = schema.get('additionalProperties', True)
+        names = schema.get('propertyNames')
+        for key, item in value.items():
+            if names is not None:
+                try:
+                    validate(key, names, root, path)
+                except DefinitionError:
+                    raise DefinitionError(f'{path}: unknown field {key!r}') from None
+            if key in properties:
+                validate(item, properties[key], root, f'{path}.{key}')
+            elif extra is False:
+                raise DefinitionError(f'{path}: unknown field {key!r}')
+            elif isinstance(extra, dict):
+                validate(item, extra, root, f'{path}.{key}')
+
+
+def _check_numbers(value, path='$'):
+    # json.load accepts NaN and Infinity, which no parameter can use
+    if isinstance(value, float) and not math.isfinite(value):
+        raise DefinitionError(f'{path}: must be a finite number, got {value}')
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _check_numbers(item, f'{path}.{key}')
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            _check_numbers(item, f'{path}[{i}]')
+
+
+# Effects that draw what a hazard simulates
+EFFECT_HAZARDS = {'water': 'flood', 'floating_debris': 'flood', 'front': 'front'}
+
+
+def _check_references(definition):
+    # Things a schema cannot express: names that must point at each other
+    name = definition['name']
+    layout = definition.get('layout', {})
+    specs = definition.get('scenery', []) + definition.get('effects', []) + definition.get('hazards', [])
+    groups = [spec.get('group') for spec in specs]
+    if 'pickups' in definition:
+        groups.append(definition['pickups']['group'])
+    for group in groups:
+        if group is not None and group not in layout:
+            raise DefinitionError(f'{name}: layout has no group {group!r}')
+    if any(h['type'] == 'flood' for h in definition.get('hazards', [])) and 'terrain' not in layout:
+        raise DefinitionError(f'{name}: a flood hazard needs layout.terrain')
+    if any(e['type'] == 'crowd' for e in definition.get('effects', [])) and 'crowd' not in definition:
+        raise DefinitionError(f'{name}: a crowd effect needs a crowd section')
+    hazards = {h['type']: h for h in definition.get('hazards', [])}
+    for effect in definition.get('effects', []):
+        needed = EFFECT_HAZARDS.get(effect['type'])
+        if needed is not None and needed not in hazards:
+            raise DefinitionError(f'{name}: a {effect["type"]} effect needs a {needed} hazard')
+        # With a debris hazard the effect draws the hazard's bodies, one per layout point
+        if effect['type'] == 'falling_debris' and 'debris' in hazards \
+                and effect['group'] != hazards['debris'].get('group'):
+            raise DefinitionError(f'{name}: falling_debris group {effect["group"]!r} is not the debris hazard\'s '
+                                  f'group {hazards["debris"].get("group")!r}')
+        if effect.get('bottom', 0) > effect.get('top', math.inf):
+            raise DefinitionError(f'{name}: {effect["type"]} effect has bottom above top')
+
+    outcomes = {'success', definition['timer']['outcome']}
+    outcomes.update(h['outcome'] for h in definition.get('hazards', []) if 'outcome' in h)
+    missing = outcomes - set(definition['text']['outcomes'])
+    if missing:
+        raise DefinitionError(f'{name}: text.outcomes has no message for {", ".join(sorted(missing))}')
+
+    # Effects triggered by an event need an event this drill can raise
+    events = set(outcomes)
+    if any(h['type'] == 'debris' for h in definition.get('hazards', [])):
+        events.add('hit')
+    if 'pickups' in definition:
+        events.add(definition['pickups']['event'])
+    for effect in definition.get('effects', []):
+        if 'event' in effect and effect['event'] not in events:
+            raise DefinitionError(f'{name}: {effect["type"]} effect waits for event {effect["event"]!r}, '
+                                  f'which never happens (one of {", ".join(sorted(events))})')
+
+
+@lru_cache(maxsize=4)
+def load_schema(directory=DEFAULT_DIR):
+    with open(os.path.join(directory, SCHEMA_FILE), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check(definition, schema):
+    _check_numbers(definition)
+    validate(definition, schema)
+    _check_references(definition)
+
+
+def load(path, schema=None):
+    with open(path, encoding='utf-8') as f:
+        try:
+            definition = json.load(f)
+        except json.JSONDecodeError as e:
+            raise DefinitionError(f'{path}: {e}') from None
+    try:
+        check(definition, schema or load_schema(os.path.dirname(path)))
+    except DefinitionError as e:
+        raise DefinitionError(f'{os.path.basename(path)}: {e}') from None
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if definition['name'] != stem:
+        raise DefinitionError(f'{path}: name {definition["name"]!r} does not match the file name')
+    return definition
+
+
+@lru_cache(maxsize=4)
+def load_all(directory=DEFAULT_DIR):
+    # Every *.json next to the schema is a scenario, ordered by id
+    schema = load_schema(directory)
+    definitions = [load(path, schema) for path in sorted(glob.glob(os.path.join(directory, '*.json')))
+                   if os.path.basename(path) != SCHEMA_FILE]
+    seen = {}
+    for definition in definitions:
+        other = seen.setdefault(definition['id'], definition['name'])
+        if other != definition['name']:
+            raise DefinitionError(f'{definition["name"]} and {other} share id {definition["id"]}')
+    return tuple(sorted(definitions, key=lambda d: d['id']))
+
+
+def get(name, directory=DEFAULT_DIR):
+    for definition in load_all(directory):
+        if definition['name'] == name:
+            return definition
+    raise KeyError(name)
+
+
+def scenario_ids(directory=DEFAULT_DIR):
+    return {d['name']: d['id'] for d in load_all(directory)}
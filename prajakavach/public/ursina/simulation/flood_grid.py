@@ -0,0 +1,133 @@
+import numpy as np
+
+GRAVITY = 9.81
+
+
+class FloodGrid:
+    # Shallow-water flood over a heightmap using the virtual pipe model: each
+    # cell exchanges water with its four neighbours through "pipes" whose flow
+    # accelerates with the difference in water surface height. Everything is
+    # whole-array NumPy work with preallocated buffers.
+    def __init__(self, terrain, extent=100.0, damping=0.002):
+        self.terrain = np.asarray(terrain, dtype=np.float32)
+        self.rows, self.cols = self.terrain.shape
+        self.extent = extent
+        self.cell = extent / self.cols
+        self.area = self.cell * self.cell
+        self.damping = damping
+        self.depth = np.zeros_like(self.terrain)
+        # Outflow from each cell towards +x, -x, +z, -z neighbours
+        self.flux = np.zeros((4,) + self.terrain.shape, dtype=np.float32)
+        self._surface = np.empty_like(self.terrain)
+        self._dx = np.empty((self.rows, self.cols - 1), dtype=np.float32)
+        self._dz = np.empty((self.rows - 1, self.cols), dtype=np.float32)
+        self._total = np.empty_like(self.terrain)
+        self._scale = np.empty_like(self.terrain)
+        self.inflow = np.full_like(self.terrain, 1.0 / self.terrain.size)
+        self.time = 0.0
+
+    # --- Coordinates: world x maps to columns, world z to rows, centred on 0 ---
+    def cell_of(self, x, z):
+        col = int((x + self.extent / 2) / self.cell)
+        row = int((z + self.extent / 2) / self.cell)
+        return min(max(row, 0), self.rows - 1), min(max(col, 0), self.cols - 1)
+
+    def depth_at(self, x, z):
+        return float(self.depth[self.cell_of(x, z)])
+
+    def depths_at(self, x, z):
+        # depth_at for arrays of positions (the batch runner's agents)
+        col = np.clip(((np.asarray(x) + self.extent / 2) / self.cell).astype(int), 0, self.cols - 1)
+        row = np.clip(((np.asarray(z) + self.extent / 2) / self.cell).astype(int), 0, self.rows - 1)
+        return self.depth[row, col]
+
+    def surface_at(self, x, z):
+        cell = self.cell_of(x, z)
+        return float(self.terrain[cell] + self.depth[cell])
+
+    @property
+    def volume(self):
+        return float(self.depth.sum(dtype=np.float64) * self.area)
+
+    def set_inflow(self, weights):
+        # Where added water enters; normalised so step() adds exactly inflow_volume
+        weights = np.asarray(weights, dtype=np.float32)
+        self.inflow = weights / weights.sum()
+
+    def max_stable_dt(self):
+        return 0.5 * self.cell / np.sqrt(GRAVITY * max(float(self.depth.max()), 1e-3))
+
+    def step(self, dt, inflow_volume=0.0):
+        # Split into substeps that respect the wave-speed (CFL) limit
+        substeps = max(1, int(np.ceil(dt / self.max_stable_dt())))
+        h = dt / substeps
+        for _ in range(substeps):
+            if inflow_volume:
+                self.depth += self.inflow * (inflow_volume / substeps / self.area)
+            self._step(h)
+        self.time += dt
+
+    def _step(self, dt):
+        surface = np.add(self.terrain, self.depth, out=self._surface)
+        f = self.flux
+        k = dt * GRAVITY  # pipe cross-section (cell^2) * g / pipe length (cell), per cell width
+
+        f *= 1.0 - self.damping
+        # Each surface difference drives the pipes both ways, so compute it once
+        dx = np.subtract(surface[:, :-1], surface[:, 1:], out=self._dx)
+        dx *= k
+        dx *= self.cell
+        f[0, :, :-1] += dx
+        f[1, :, 1:] -= dx
+        dz = np.subtract(surface[:-1, :], surface[1:, :], out=self._dz)
+        dz *= k
+        dz *= self.cell
+        f[2, :-1, :] += dz
+        f[3, 1:, :] -= dz
+        np.maximum(f, 0.0, out=f)
+        # Closed boundaries
+        f[0, :, -1] = 0.0
+        f[1, :, 0] = 0.0
+        f[2, -1, :] = 0.0
+        f[3, 0, :] = 0.0
+
+        # Never let a cell send out more water than it holds
+        total = np.add(f[0], f[1], out=self._total)
+        total += f[2]
+        total += f[3]
+        total *= dt
+        scale = np.multiply(self.depth, self.area, out=self._scale)
+        # Cells with no outflow divide by zero; fmin turns their inf/nan into 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale /= total
+        np.fmin(scale, 1.0, out=scale)
+        f *= scale
+
+        net = np.add(f[0], f[1], out=self._total)
+        net += f[2]
+        net += f[3]
+        np.negative(net, out=net)
+        net[:, 1:] += f[0, :, :-1]
+        net[:, :-1] += f[1, :, 1:]
+        net[1:, :] += f[2, :-1, :]
+        net[:-1, :] += f[3, 1:, :]
+        net *= dt / self.area
+        self.depth += net
+        np.maximum(self.depth, 0.0, out=self.depth)
+
+
+def default_terrain(size=256, extent=100.0, seed=0, plateaus=()):
+    # Gentle slope down to the west with smooth bumps, plus flat-topped
+    # plateaus (x, z, half_x, half_z, height) for buildings or high ground.
+    rng = np.random.default_rng(seed)
+    coords = (np.arange(size, dtype=np.float32) + 0.5) / size * extent - extent / 2
+    x, z = np.meshgrid(coords, coords)
+    terrain = 0.004 * (x + extent / 2)
+    for _ in range(6):
+        cx, cz = rng.uniform(-extent / 2, extent / 2, 2)
+        radius = rng.uniform(5, 15)
+        terrain += rng.uniform(-0.15, 0.15) * np.exp(-((x - cx) ** 2 + (z - cz) ** 2) / (2 * radius ** 2))
+    for px, pz, hx, hz, height in plateaus:
+        mask = (np.abs(x - px) < hx) & (np.abs(z - pz) < hz)
+        terrain[mask] = np.maximum(terrain[mask], height)
+    return terrain.astype(np.float32)
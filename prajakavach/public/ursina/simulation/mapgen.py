@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from simulation import definitions
+from simulation.flood_grid import default_terrain
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(HERE, 'maps')
+
+# Bump when generation changes so stale cache files are never reused
+VERSION = 1
+
+# Layouts smaller than this are cheaper to regenerate than to read from disk
+DISK_MIN_BYTES = 64 * 1024
+disk_cache = True
+DISK_ENTRIES = 32  # files kept in the cache directory; the least recently used go first
+MEMORY_ENTRIES = 16
+
+# Columns of every placement array
+X, Y, Z, SIZE, SPEED = range(5)
+
+# Layouts come from the `layout` section of each scenario definition. Each group
+# is `count` items drawn uniformly from the ranges; a range with equal ends is a
+# fixed value. `terrain` is a flood heightmap (see default_terrain).
+
+
+@dataclass
+class MapLayout:
+    scenario: str
+    seed: int
+    config: dict
+    groups: dict = field(default_factory=dict)  # name -> float32 (count, 5) array
+    terrain: Optional[np.ndarray] = None
+    from_cache: bool = False
+
+    def __getitem__(self, name):
+        return self.groups[name]
+
+    @property
+    def nbytes(self):
+        size = sum(a.nbytes for a in self.groups.values())
+        return size + (self.terrain.nbytes if self.terrain is not None else 0)
+
+
+_memory = OrderedDict()
+
+
+def resolve_config(scenario, overrides=None):
+    # Overrides replace individual fields of a group: {'terrain': {'size': 128}}
+    config = json.loads(json.dumps(definitions.get(scenario).get('layout', {})))
+    for name, values in (overrides or {}).items():
+        config.setdefault(name, {}).update(values)
+    return json.loads(json.dumps(config))  # tuples become lists, as in the cache key
+
+
+def cache_key(scenario, seed, config):
+    blob = json.dumps({'version': VERSION, 'scenario': scenario, 'seed': seed, 'config': config},
+                      sort_keys=True)
+    return hashlib.sha1(blob.encode()).hexdigest()[:16]
+
+
+def build(scenario, seed, config):
+    groups = {}
+    for index, name in enumerate(sorted(n for n in config if n != 'terrain')):
+        spec = config[name]
+        rng = np.random.default_rng([seed, index])
+        columns = [spec.get(axis, (0, 0)) for axis in ('x', 'y', 'z')]
+        columns += [spec.get('size', (1, 1)), spec.get('speed', (0, 0))]
+        low = np.array([c[0] for c in columns], dtype=np.float64)
+        high = np.array([c[1] for c in columns], dtype=np.float64)
+        groups[name] = rng.uniform(low, high, (spec['count'], len(columns))).astype(np.float32)
+
+    terrain = None
+    if 'terrain' in config:
+        spec = config['terrain']
+        terrain = default_terrain(spec['size'], spec['extent'], seed,
+                                  plateaus=[tuple(p) for p in spec.get('plateaus', ())])
+    return MapLayout(scenario, seed, config, groups, terrain)
+
+
+def _path(scenario, seed, key, cache_dir):
+    return os.path.join(cache_dir, f'{scenario}-{seed}-{key}.npz')
+
+
+def _load(path, scenario, seed, config):
+    try:
+        with np.load(path) as data:
+            groups = {name[6:]: data[name] for name in data.files if name.startswith('group_')}
+            terrain = data['terrain'] if 'terrain' in data.files else None
+    except (OSError, ValueError, KeyError):
+        return None  # unreadable or half-written; regenerate
+    return MapLayout(scenario, seed, config, groups, terrain, from_cache=True)
+
+
+def _save(path, layout):
+    arrays = {f'group_{name}': a for name, a in layout.groups.items()}
+    if layout.terrain is not None:
+        arrays['terrain'] = layout.terrain
+    arrays['meta'] = np.array(json.dumps({'version': VERSION, 'scenario': layout.scenario,
+                                          'seed': layout.seed, 'config': layout.config}))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)  # atomic, so concurrent drills never read a partial file
+
+
+def _prune(cache_dir, keep=None):
+    # Seeds are random on every launch unless one is pinned, so most files are
+    # never read again. Loads touch their file, so mtime order is LRU order.
+    try:
+        names = [n for n in os.listdir(cache_dir) if n.endswith('.npz')]
+    except OSError:
+        return
+    keep = DISK_ENTRIES if keep is None else keep
+    if len(names) <= keep:
+        return
+    paths = [os.path.join(cache_dir, n) for n in names]
+    times = {}
+    for path in paths:
+        try:
+            times[path] = os.path.getmtime(path)
+        except OSError:
+            pass  # removed by another drill meanwhile
+    for path in sorted(times, key=times.get)[:len(times) - keep]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def generate(scenario, seed, overrides=None, cache_dir=DEFAULT_DIR):
+    # Same seed and config always give the same layout; results are kept in
+    # memory and, for large maps, in cache_dir keyed by a hash of both.
+    seed = int(seed or 0)
+    config = resolve_config(scenario, overrides)
+    key = cache_key(scenario, seed, config)
+    layout = _memory.get(key)
+    if layout is not None:
+        _memory.move_to_end(key)
+        return layout
+
+    path = _path(scenario, seed, key, cache_dir)
+    layout = _load(path, scenario, seed, config) if os.path.exists(path) else None
+    if layout is not None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    else:
+        layout = build(scenario, seed, config)
+        if disk_cache and layout.nbytes >= DISK_MIN_BYTES:
+            _save(path, layout)
+            _prune(cache_dir)
+
+    _memory[key] = layout
+    if len(_memory) > MEMORY_ENTRIES:
+        _memory.popitem(last=False)
+    return layout
+
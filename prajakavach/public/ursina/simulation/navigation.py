@@ -0,0 +1,267 @@
+import math
+
+import numpy as np
+
+# Eight neighbours as (row, col) offsets; rows follow world z, columns world x
+OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+COSTS = [1.0, 1.0, 1.0, 1.0, math.sqrt(2), math.sqrt(2), math.sqrt(2), math.sqrt(2)]
+DIRECTIONS = np.array([(dc, dr) for dr, dc in OFFSETS], dtype=np.float32)
+DIRECTIONS /= np.hypot(DIRECTIONS[:, 0], DIRECTIONS[:, 1])[:, None]
+UNREACHABLE = np.float32(np.inf)
+
+
+def _grow(mask):
+    # mask plus its eight neighbours
+    padded = np.zeros((mask.shape[0] + 2, mask.shape[1] + 2), dtype=bool)
+    padded[1:-1, 1:-1] = mask
+    grown = mask.copy()
+    rows, cols = mask.shape
+    for dr, dc in OFFSETS:
+        grown |= padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc]
+    return grown
+
+
+class NavGrid:
+    # Walkable cells on the ground plane, centred on 0 like FloodGrid. Static
+    # obstacles are baked once; flooded and blocked cells change during a drill.
+    def __init__(self, extent=100.0, cell=0.5):
+        self.extent = extent
+        self.cell = cell
+        self.rows = self.cols = int(math.ceil(extent / cell))
+        shape = (self.rows, self.cols)
+        self.solid = np.zeros(shape, dtype=bool)
+        self.flooded = np.zeros(shape, dtype=bool)
+        self.blocked = np.zeros(shape, dtype=bool)
+        centres = (np.arange(self.cols) + 0.5) * cell - extent / 2
+        self.xs, self.zs = np.meshgrid(centres, centres)
+        self._flood_cells = None
+
+    def copy(self):
+        grid = NavGrid.__new__(NavGrid)
+        grid.__dict__.update(self.__dict__)
+        grid.solid = self.solid.copy()
+        grid.flooded = self.flooded.copy()
+        grid.blocked = self.blocked.copy()
+        return grid
+
+    @property
+    def walkable(self):
+        return ~(self.solid | self.flooded | self.blocked)
+
+    def cell_of(self, x, z):
+        col = int((x + self.extent / 2) / self.cell)
+        row = int((z + self.extent / 2) / self.cell)
+        return min(max(row, 0), self.rows - 1), min(max(col, 0), self.cols - 1)
+
+    def cells_of(self, points):
+        idx = ((points + self.extent / 2) / self.cell).astype(np.int64)
+        np.clip(idx, 0, self.rows - 1, out=idx)
+        return idx[:, 1], idx[:, 0]
+
+    def _box(self, cx, cz, hx, hz):
+        return (np.abs(self.xs - cx) < hx) & (np.abs(self.zs - cz) < hz)
+
+    def add_box(self, cx, cz, hx, hz, pad=0.0):
+        # pad is the agent radius, so a walkable cell centre always has room for a body
+        self.solid |= self._box(cx, cz, hx + pad, hz + pad)
+
+    def block(self, x, z, radius):
+        # Debris or a collapse closing part of a route
+        self.blocked |= np.hypot(self.xs - x, self.zs - z) < radius
+
+    def clear_blocked(self):
+        self.blocked[:] = False
+
+    def update_flood(self, flood, max_depth=0.3):
+        # Cells where the water is deeper than people can wade through
+        if self._flood_cells is None:
+            cols = ((self.xs + flood.extent / 2) / flood.cell).astype(np.int64)
+            rows = ((self.zs + flood.extent / 2) / flood.cell).astype(np.int64)
+            self._flood_cells = np.clip(rows, 0, flood.rows - 1), np.clip(cols, 0, flood.cols - 1)
+        np.greater(flood.depth[self._flood_cells], max_depth, out=self.flooded)
+
+
+class FlowField:
+    # Distance to the nearest goal from every cell (8-neighbour, no corner
+    # cutting) and the direction to walk from each cell. refresh() only redoes
+    # the cells a change in the grid can affect, and while cells only close (the
+    # water rising) only the block of the grid around them, so re-planning
+    # costs a fraction of the first bake, and a direction query is one lookup.
+    def __init__(self, grid, goals):
+        self.grid = grid
+        goals = np.asarray(goals, dtype=np.float64).reshape(-1, 3)  # x, z, radius
+        self.goal = np.zeros((grid.rows, grid.cols), dtype=bool)
+        for x, z, radius in goals:
+            self.goal |= np.hypot(grid.xs - x, grid.zs - z) < radius
+        self.goals = goals
+        shape = (grid.rows + 2, grid.cols + 2)
+        self._dist = np.full(shape, UNREACHABLE, dtype=np.float32)  # padded with an unreachable border
+        self.distance = self._dist[1:-1, 1:-1]
+        self.parent = np.full(grid.rows * grid.cols, -1, dtype=np.int64)
+        self.directions = np.zeros((grid.rows, grid.cols, 2), dtype=np.float32)
+        self._walk = np.zeros((grid.rows, grid.cols), dtype=bool)
+        self.iterations = 0
+        self._pending = None  # (costs, rows, cols) of a re-plan still settling
+        self.refresh()
+
+    def copy(self):
+        # An independent field over a copy of the grid; cheaper than baking again
+        field = FlowField.__new__(FlowField)
+        field.__dict__.update(self.__dict__)
+        field.grid = self.grid.copy()
+        field._dist = self._dist.copy()
+        field.distance = field._dist[1:-1, 1:-1]
+        field.parent = self.parent.copy()
+        field.directions = self.directions.copy()
+        field._walk = self._walk.copy()
+        return field
+
+    def _costs(self, walk):
+        # Diagonal steps need both orthogonal neighbours open, or agents clip corners
+        padded = np.zeros((self.grid.rows + 2, self.grid.cols + 2), dtype=bool)
+        padded[1:-1, 1:-1] = walk
+        rows, cols = walk.shape
+        costs = []
+        for (dr, dc), cost in zip(OFFSETS, COSTS):
+            if dr and dc:
+                open_ = padded[1 + dr:rows + 1 + dr, 1:-1] & padded[1:-1, 1 + dc:cols + 1 + dc]
+                costs.append(np.where(open_, np.float32(cost), UNREACHABLE))
+            else:
+                costs.append(np.float32(cost))
+        return costs
+
+    def _candidates(self, costs, out, rows, cols):
+        # Distance through each neighbour for the block of cells rows x cols
+        d = self._dist
+        for k, (dr, dc) in enumerate(OFFSETS):
+            cost = costs[k][rows, cols] if np.ndim(costs[k]) else costs[k]
+            np.add(d[rows.start + 1 + dr:rows.stop + 1 + dr, cols.start + 1 + dc:cols.stop + 1 + dc], cost, out=out[k])
+        return out
+
+    def _relax(self, budget=None):
+        # Jacobi sweeps over the pending block until nothing improves (a warm
+        # start converges in a few) or budget sweeps have run; returns whether
+        # the block has settled
+        costs, rows, cols = self._pending
+        distance = self.distance[rows, cols]
+        goal = self.goal[rows, cols]
+        walls = ~self._walk[rows, cols]
+        candidates = np.empty((len(OFFSETS),) + distance.shape, dtype=np.float32)
+        best = np.empty(distance.shape, dtype=np.float32)
+        sweeps = 0
+        while budget is None or sweeps < budget:
+            self._candidates(costs, candidates, rows, cols)
+            candidates.min(axis=0, out=best)
+            best[goal] = 0.0
+            best[walls] = UNREACHABLE
+            sweeps += 1
+            if not (best < distance).any():
+                self.iterations += sweeps
+                self._finish(costs, rows, cols, candidates)
+                self._pending = None
+                return True
+            distance[...] = best
+        self.iterations += sweeps
+        return False
+
+    def _finish(self, costs, rows, cols, candidates):
+        # Parents and directions from the converged distances
+        distance = self.distance[rows, cols]
+        goal = self.goal[rows, cols]
+        self._candidates(costs, candidates, rows, cols)
+        step = candidates.argmin(axis=0)
+        reachable = np.isfinite(distance) & ~goal
+        offsets = np.array(OFFSETS)[step]
+        flat = (np.arange(rows.start, rows.stop)[:, None] + offsets[..., 0]) * self.grid.cols \
+            + np.arange(cols.start, cols.stop)[None, :] + offsets[..., 1]
+        self.parent.reshape(self.grid.rows, self.grid.cols)[rows, cols] = np.where(reachable, flat, -1)
+        # Walk down the slope of the distance field, blending every downhill
+        # neighbour, so routes are not limited to eight compass directions
+        zero = [np.float32(0.0)] * len(OFFSETS)
+        neighbours = self._candidates(zero, np.empty_like(candidates), rows, cols)
+        with np.errstate(invalid='ignore'):
+            drop = np.nan_to_num((distance[None] - neighbours) / np.array(COSTS, np.float32)[:, None, None],
+                                 nan=0.0, posinf=0.0, neginf=0.0)
+        np.maximum(drop, 0.0, out=drop)
+        slope = np.einsum('krc,kd->rcd', drop, DIRECTIONS)
+        length = np.hypot(slope[..., 0], slope[..., 1])[..., None]
+        slope = np.where(length > 1e-6, slope / np.maximum(length, 1e-6), DIRECTIONS[step])
+        self.directions[rows, cols] = np.where(reachable[..., None], slope, 0.0)
+
+    def _block(self, mask):
+        # Rows and columns around every set cell, one cell wider on each side:
+        # the cells whose distance, parent or direction can depend on them
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        return (slice(max(rows[0] - 1, 0), min(rows[-1] + 2, self.grid.rows)),
+                slice(max(cols[0] - 1, 0), min(cols[-1] + 2, self.grid.cols)))
+
+    def _descendants(self, cells):
+        # Every cell whose route to a goal runs through one of these cells
+        affected = cells.ravel().copy()
+        parent = self.parent
+        has_parent = parent >= 0
+        while True:
+            grown = affected | (has_parent & affected[np.maximum(parent, 0)])
+            if (grown == affected).all():
+                return grown.reshape(cells.shape)
+            affected = grown
+
+    def refresh(self, budget=None):
+        # Re-plan after the grid changed; returns how many cells opened or closed.
+        # With a budget at most that many sweeps run now and settle() finishes
+        # the job on later ticks; until then the old directions stay in use.
+        walk = self.grid.walkable | self.goal
+        changed = walk != self._walk
+        count = int(changed.sum())
+        if not count:
+            return 0
+        # Parents are only up to date once the previous re-plan has settled
+        self.settle()
+        closed = changed & ~walk
+        opened = changed & walk
+        reset = opened.copy()
+        if closed.any():
+            # Cells routed through a closed cell, or diagonally past its corner
+            reset |= self._descendants(_grow(closed))
+        self._walk = walk
+        self.distance[reset | ~walk] = UNREACHABLE
+        if opened.any():
+            # A new opening can shorten routes anywhere on the grid
+            block = slice(0, self.grid.rows), slice(0, self.grid.cols)
+        else:
+            # Closing cells only lengthens the routes through them, and every
+            # new route stays inside the block around them
+            block = self._block(reset | changed)
+        self._pending = (self._costs(walk),) + block
+        self.iterations = 0
+        self._relax(budget)
+        return count
+
+    def settle(self, budget=None):
+        # Carry on with an unfinished re-plan; True once the field is up to date
+        if self._pending is None:
+            return True
+        return self._relax(budget)
+
+    # --- Queries ---
+    def direction(self, x, z):
+        # Unit (dx, dz) towards the nearest goal; (0, 0) at a goal or when cut off
+        return self.directions[self.grid.cell_of(x, z)]
+
+    def directions_at(self, points):
+        rows, cols = self.grid.cells_of(points)
+        return self.directions[rows, cols]
+
+    def distance_at(self, x, z):
+        return float(self.distance[self.grid.cell_of(x, z)])
+
+    def path(self, x, z, limit=1000):
+        # Cell centres from (x, z) to a goal, e.g. to draw a route hint
+        row, col = self.grid.cell_of(x, z)
+        cell = row * self.grid.cols + col
+        points = []
+        while cell >= 0 and len(points) < limit:
+            points.append((float(self.grid.xs.flat[cell]), float(self.grid.zs.flat[cell])))
+            cell = self.parent[cell]
+        return points
@@ -0,0 +1,160 @@
+import atexit
+import os
+import queue
+import struct
+import threading
+import time
+
+from simulation import SCENARIOS, definitions
+from simulation.common import FAILURES, FIXED_DT, Inputs
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(HERE, 'replays')
+
+# --- File format ---
+# MAGIC + header, then run-length encoded input masks, one mask per fixed step.
+# The simulation is deterministic given the seed and the steps, so this is
+# all that is needed to reproduce an attempt exactly.
+MAGIC = b'PKRP'
+VERSION = 2
+HEADER = struct.Struct('<BBQdIiB')  # version, scenario id, seed, dt, steps, score, outcome
+RUN = struct.Struct('<BH')  # input mask, repeat count
+MAX_RUN = 0xFFFF
+
+OUTCOMES = ['success', *FAILURES]
+NO_OUTCOME = 0xFF
+
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+_INPUTS = [Inputs(bool(m & UP), bool(m & DOWN), bool(m & LEFT), bool(m & RIGHT)) for m in range(16)]
+
+
+def input_mask(inputs):
+    return (UP * inputs.up) | (DOWN * inputs.down) | (LEFT * inputs.left) | (RIGHT * inputs.right)
+
+
+class Recording:
+    def __init__(self, scenario, seed, dt=FIXED_DT):
+        self.scenario = scenario
+        self.seed = seed or 0
+        self.dt = dt
+        self.runs = []  # [mask, count]
+        self.steps = 0
+        self.score = 0
+        self.outcome = None
+
+    def record(self, inputs):
+        mask = input_mask(inputs)
+        runs = self.runs
+        if runs and runs[-1][0] == mask and runs[-1][1] < MAX_RUN:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+        self.steps += 1
+
+    def finish(self, state):
+        self.score = state.score
+        self.outcome = state.outcome
+
+    def inputs(self):
+        for mask, count in self.runs:
+            inputs = _INPUTS[mask]
+            for _ in range(count):
+                yield inputs
+
+    def to_bytes(self):
+        outcome = NO_OUTCOME if self.outcome is None else OUTCOMES.index(self.outcome)
+        header = HEADER.pack(VERSION, SCENARIOS[self.scenario].id, self.seed,
+                             self.dt, self.steps, self.score, outcome)
+        return MAGIC + header + b''.join(RUN.pack(mask, count) for mask, count in self.runs)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError('not a drill replay')
+        version, scenario, seed, dt, steps, score, outcome = HEADER.unpack_from(data, len(MAGIC))
+        if version != VERSION:
+            raise ValueError(f'unsupported replay version {version}')
+        names = {i: name for name, i in definitions.scenario_ids().items()}
+        if scenario not in names:
+            raise ValueError(f'replay of unknown scenario #{scenario}')
+        recording = cls(names[scenario], seed, dt)
+        recording.runs = [list(run) for run in RUN.iter_unpack(data[len(MAGIC) + HEADER.size:])]
+        recording.steps = steps
+        recording.score = score
+        recording.outcome = None if outcome == NO_OUTCOME else OUTCOMES[outcome]
+        return recording
+
+    def default_path(self, tag=0):
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        return os.path.join(DEFAULT_DIR, f'{self.scenario}-{stamp}-{tag:08x}.pkrp')
+
+    def save(self, path=None, tag=0):
+        if path is None:
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+            path = self.default_path(tag)
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayWriter:
+    # Saves finished attempts from a background thread. save() only encodes the
+    # recording (a few kilobytes) and enqueues it, so the drill that just ended
+    # never waits on the disk inside its frame update.
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name='replay-writer', daemon=True)
+        self.thread.start()
+
+    def save(self, recording, tag=0):
+        path = recording.default_path(tag)
+        self.queue.put((path, recording.to_bytes()))
+        return path
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                path, data = item
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        self.queue.join()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+
+_writer = None
+
+
+def get_writer():
+    # Opened only by scenes that record attempts, never by playback
+    global _writer
+    if _writer is None:
+        _writer = ReplayWriter()
+        atexit.register(_writer.close)
+    return _writer
+
+
+def replay(recording):
+    # Re-run an attempt without a window; returns the final state
+    scenario = SCENARIOS[recording.scenario]
+    state = scenario.new_state(recording.seed)
+    dt = recording.dt
+    for inputs in recording.inputs():
+        scenario.step(state, inputs, dt)
+    return state
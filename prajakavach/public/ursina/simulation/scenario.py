@@ -0,0 +1,245 @@
+import math
+import random
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from simulation import mapgen
+from simulation.common import FAILURES, Player
+from simulation.debris import DebrisBodies
+from simulation.definitions import DefinitionError
+from simulation.flood_grid import FloodGrid
+from simulation.spatial import SpatialGrid
+
+
+@dataclass
+class Pickup:
+    x: float
+    y: float
+    z: float
+    active: bool = True
+
+
+@dataclass
+class DrillState:
+    seed: Optional[int] = None
+    player: Player = field(default_factory=Player)
+    remaining: float = 0.0  # the drill's timer: time, heat resistance, thirst...
+    elapsed: float = 0.0
+    score: int = 0
+    outcome: Optional[str] = None
+    events: list = field(default_factory=list)
+    triggers: SpatialGrid = field(default_factory=SpatialGrid)
+    pickups: list = field(default_factory=list)
+    flood: Optional[FloodGrid] = None
+    water_height: float = 0.0  # level the added flood water would reach if spread evenly
+    front_x: Optional[float] = None
+    debris: Optional[DebrisBodies] = None
+    injuries: int = 0
+
+
+# --- Hazards: the rules a definition can switch on, with their parameters ---
+REQUIRED = object()
+
+
+class Hazard:
+    PARAMS = {}
+
+    def __init__(self, spec, scenario):
+        unknown = set(spec) - set(self.PARAMS) - {'type'}
+        if unknown:
+            raise DefinitionError(f'{scenario.name}: unknown {spec["type"]} parameter(s) {", ".join(sorted(unknown))}')
+        for key, default in self.PARAMS.items():
+            value = spec.get(key, default)
+            if value is REQUIRED:
+                raise DefinitionError(f'{scenario.name}: {spec["type"]} hazard needs {key!r}')
+            setattr(self, key, value)
+        if 'outcome' in self.PARAMS and self.outcome not in FAILURES:
+            raise DefinitionError(f'{scenario.name}: {spec["type"]} outcome {self.outcome!r} is not one of {", ".join(FAILURES)}')
+        self.scenario = scenario
+
+    def reset(self, state):
+        pass
+
+    def advance(self, state, dt):
+        pass
+
+    def check(self, state):
+        return None
+
+
+def rise_rate(time_remaining, duration, base, accel):
+    # Flood rising (accelerates over time)
+    return base + (duration - time_remaining) / duration * accel
+
+
+@lru_cache(maxsize=8)
+def _inflow(size, river_share):
+    # Share of the water enters along the west edge like a river; the rest falls as rain
+    inflow = np.full((size, size), (1 - river_share) / (size * size), dtype=np.float32)
+    inflow[:, :2] += river_share / (2 * size)
+    return inflow
+
+
+class FloodHazard(Hazard):
+    PARAMS = {'rise_base': 0.01, 'rise_accel': 0.1, 'river_share': 0.5, 'grid_size': None,
+              'outcome': REQUIRED}
+
+    def reset(self, state):
+        size = self.grid_size
+        layout = mapgen.generate(self.scenario.name, state.seed, {'terrain': {'size': size}} if size else None)
+        self.extent = layout.config['terrain']['extent']
+        state.flood = FloodGrid(layout.terrain, self.extent)
+        state.flood.set_inflow(_inflow(layout.terrain.shape[0], self.river_share))
+
+    def advance(self, state, dt):
+        # Same water volume as a single flat level rising at rise_rate, spread over the heightmap
+        rise = rise_rate(state.remaining, self.scenario.timer_start, self.rise_base, self.rise_accel) * dt
+        state.water_height += rise
+        state.flood.step(dt, rise * self.extent * self.extent)
+
+    def check(self, state):
+        # The player walks on the flat ground at z = 0, so local depth is what matters
+        if state.player.y < state.flood.depth_at(state.player.x, 0.0):
+            return self.outcome
+
+
+class WindHazard(Hazard):
+    # Pushes the player along x; negative strength blows back towards the start
+    PARAMS = {'strength': REQUIRED, 'gust': 0.0, 'period': 4.0}
+
+    def advance(self, state, dt):
+        push = self.strength + self.gust * math.sin(2 * math.pi * state.elapsed / self.period)
+        state.player.x += push * dt
+
+
+class FrontHazard(Hazard):
+    # A wall (landslide, mudflow, fire line) sweeping along +x that catches the player
+    PARAMS = {'start_x': REQUIRED, 'speed': REQUIRED, 'accel': 0.0, 'outcome': REQUIRED}
+
+    def reset(self, state):
+        state.front_x = self.start_x
+
+    def advance(self, state, dt):
+        t = state.elapsed + dt
+        state.front_x = self.start_x + self.speed * t + 0.5 * self.accel * t * t
+
+    def check(self, state):
+        if state.player.x < state.front_x:
+            return self.outcome
+
+
+class DebrisHazard(Hazard):
+    # A layout group falling as rigid bodies (simulation.debris) between two release
+    # times; hard hits on the player are injuries, and enough of them end the drill
+    PARAMS = {'group': REQUIRED, 'release': (0.0, 0.0), 'hits': 1, 'min_speed': 3.0, 'outcome': REQUIRED}
+
+    def __init__(self, spec, scenario):
+        super().__init__(spec, scenario)
+        # Structures are the static boxes debris lands on
+        self.boxes = [tuple(s['position']) + tuple(v / 2 for v in s['scale'])
+                      for s in scenario.definition.get('structures', [])]
+
+    def reset(self, state):
+        points = mapgen.generate(self.scenario.name, state.seed)[self.group]
+        release = np.random.default_rng([state.seed, 1]).uniform(*self.release, len(points))
+        state.debris = DebrisBodies(points, self.boxes, release)
+        state.injuries = 0
+
+    def advance(self, state, dt):
+        state.debris.step(dt)
+        hits = state.debris.hit_player(state.player.x, state.player.y, self.min_speed)
+        if hits:
+            state.injuries += hits
+            state.events.append('hit')
+
+    def check(self, state):
+        if state.injuries >= self.hits:
+            return self.outcome
+
+
+HAZARDS = {
+    'flood': FloodHazard,
+    'wind': WindHazard,
+    'front': FrontHazard,
+    'debris': DebrisHazard,
+}
+
+
+class Scenario:
+    # Rules for one drill, built from its definition. Has the same
+    # new_state(seed) / step(state, inputs, dt) interface every runner uses.
+    def __init__(self, definition, overrides=None):
+        self.definition = definition
+        self.name = definition['name']
+        self.id = definition['id']
+        self.speed = definition['player']['speed']
+        timer = definition['timer']
+        self.timer_start = timer['start']
+        self.drain = timer.get('drain', 1.0)
+        self.timer_outcome = timer['outcome']
+        goal = definition['goal']
+        self.goal_x, self.goal_y, self.goal_radius = goal['x'], goal['y'], goal['radius']
+        self.score_base = definition['score']['base']
+        self.score_per_second = definition['score']['per_second']
+        self.pickups = definition.get('pickups')
+        # overrides: {'flood': {'grid_size': 128}} replaces hazard parameters by type
+        overrides = overrides or {}
+        self.hazards = [HAZARDS[spec['type']](dict(spec, **overrides.get(spec['type'], {})), self)
+                        for spec in definition.get('hazards', [])]
+
+    def new_state(self, seed=None):
+        # Draw a seed so restarting with state.seed keeps the same layout
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        state = DrillState(seed=seed, remaining=self.timer_start)
+        state.triggers.insert('goal', self.goal_x, self.goal_y, self.goal_radius)
+        if self.pickups is not None:
+            layout = mapgen.generate(self.name, seed)
+            radius = self.pickups['radius']
+            for i, (x, y, z) in enumerate(layout[self.pickups['group']][:, :mapgen.SIZE]):
+                state.pickups.append(Pickup(float(x), float(y), float(z)))
+                state.triggers.insert(i, float(x), float(y), radius)
+        for hazard in self.hazards:
+            hazard.reset(state)
+        return state
+
+    def advance(self, state, dt):
+        # Hazards and the timer, without the player (crowd runs use this on its own)
+        for hazard in self.hazards:
+            hazard.advance(state, dt)
+        state.remaining -= dt * self.drain
+        state.elapsed += dt
+
+    def step(self, state, inputs, dt):
+        if state.outcome is not None:
+            return state
+
+        player = state.player
+        player.move(inputs, self.speed * dt)
+        self.advance(state, dt)
+
+        # Pickups have integer keys; the goal is 'goal'
+        hits = state.triggers.query_point(player.x, player.y)
+        if self.pickups is not None:
+            for key in sorted(k for k in hits if k != 'goal'):
+                state.pickups[key].active = False
+                state.remaining = min(state.remaining + self.pickups['restore'], self.timer_start)
+                state.triggers.remove(key)
+                state.events.append(self.pickups['event'])
+
+        for hazard in self.hazards:
+            state.outcome = hazard.check(state)
+            if state.outcome is not None:
+                break
+        else:
+            if 'goal' in hits:
+                state.outcome = 'success'
+                state.score = self.score_base + int(state.remaining * self.score_per_second)
+            elif state.remaining <= 0:
+                state.outcome = self.timer_outcome
+        if state.outcome is not None:
+            state.events.append(state.outcome)
+        return state
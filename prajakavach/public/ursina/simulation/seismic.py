@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+
+P_SPEED = 6.0  # km/s
+S_SPEED = 3.5
+
+
+class SeismicShake:
+    # Ground motion at the drill site from one earthquake. P waves arrive first
+    # (weak, fast, mostly vertical), S waves follow (several times stronger,
+    # slower, mostly sideways). Each phase rises and decays with a Saragoni-Hart
+    # style envelope; amplitude and duration grow with magnitude and fall off
+    # with distance. Deterministic for a seed, so replays shake the same way.
+    def __init__(self, magnitude=6.5, distance=10.0, seed=0, amplitude=0.05, rotation=2.0):
+        rng = np.random.default_rng(seed)
+        self.p_arrival = distance / P_SPEED
+        self.s_arrival = distance / S_SPEED
+        # 10x the amplitude per 2 magnitudes, scaled to 1 at M6.5 and 10 km
+        strength = 10 ** ((magnitude - 6.5) / 2) * 20.0 / (distance + 10.0)
+        self.amplitude = amplitude * strength
+        self.rotation = rotation * strength
+        self.duration = 10 ** (0.5 * magnitude - 2.2)  # strong shaking, ~11 s at M6.5
+        # Each component is a few sinusoids with seeded frequencies and phases
+        self.p_waves = self._waves(rng, (5.0, 12.0))
+        self.s_waves = self._waves(rng, (1.0, 4.0))
+
+    @staticmethod
+    def _waves(rng, band, count=3, components=3):
+        freq = rng.uniform(*band, (components, count)) * 2 * math.pi
+        phase = rng.uniform(0, 2 * math.pi, (components, count))
+        return freq, phase
+
+    @staticmethod
+    def _signal(waves, t):
+        freq, phase = waves
+        return np.sin(np.multiply.outer(t, freq) + phase).sum(axis=-1) / freq.shape[1]
+
+    def envelope(self, t, arrival, peak):
+        tau = np.maximum(np.asarray(t, dtype=np.float64) - arrival, 0.0) / peak
+        return tau * tau * np.exp(2.0 * (1.0 - tau))
+
+    def at(self, t):
+        # (dx, dy, rotation_z) at time t seconds after the rupture; t may be an array
+        t = np.asarray(t, dtype=np.float64)
+        p = self.envelope(t, self.p_arrival, 0.1 * self.duration) * 0.3
+        s = self.envelope(t, self.s_arrival, 0.25 * self.duration)
+        wp = self._signal(self.p_waves, t)
+        ws = self._signal(self.s_waves, t)
+        dx = self.amplitude * (s * ws[..., 0] + 0.3 * p * wp[..., 0])
+        dy = self.amplitude * (p * wp[..., 1] + 0.3 * s * ws[..., 1])
+        rotation = self.rotation * s * ws[..., 2]
+        return dx, dy, rotation
@@ -0,0 +1,78 @@
+from math import floor
+
+
+class SpatialGrid:
+    # Uniform grid over the x/y plane. Each item is a box (centre plus half
+    # size) registered in every cell it overlaps, so a point query looks at a
+    # single cell whatever the number of items on the map.
+    def __init__(self, cell_size=4.0):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def _cell(self, v):
+        return int(floor(v / self.cell_size))
+
+    def _span(self, min_x, min_y, max_x, max_y):
+        for cx in range(self._cell(min_x), self._cell(max_x) + 1):
+            for cy in range(self._cell(min_y), self._cell(max_y) + 1):
+                yield cx, cy
+
+    def insert(self, key, x, y, half_size=0.0):
+        if key in self.items:
+            self.remove(key)
+        cells = list(self._span(x - half_size, y - half_size, x + half_size, y + half_size))
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(key)
+        self.items[key] = (x, y, half_size, cells)
+
+    def remove(self, key):
+        x, y, half_size, cells = self.items.pop(key)
+        for cell in cells:
+            bucket = self.cells[cell]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[cell]
+
+    def move(self, key, x, y):
+        self.insert(key, x, y, self.items[key][2])
+
+    def position(self, key):
+        x, y, half_size, _ = self.items[key]
+        return x, y, half_size
+
+    def query_point(self, px, py):
+        # Items whose box contains the point (same strict test as near())
+        hits = []
+        for key in self.cells.get((self._cell(px), self._cell(py)), ()):
+            x, y, half_size, _ = self.items[key]
+            if abs(px - x) < half_size and abs(py - y) < half_size:
+                hits.append(key)
+        return hits
+
+    def query_aabb(self, min_x, min_y, max_x, max_y):
+        # Items whose box overlaps the query box
+        seen = set()
+        hits = []
+        for cell in self._span(min_x, min_y, max_x, max_y):
+            for key in self.cells.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                x, y, half_size, _ = self.items[key]
+                if (x + half_size > min_x and x - half_size < max_x
+                        and y + half_size > min_y and y - half_size < max_y):
+                    hits.append(key)
+        return hits
+
+    def query_radius(self, px, py, radius):
+        # Items whose centre lies within `radius` of the point
+        r2 = radius * radius
+        return [key for key in self.query_aabb(px - radius, py - radius, px + radius, py + radius)
+                if (self.items[key][0] - px) ** 2 + (self.items[key][1] - py) ** 2 <= r2]
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def app():
+    # One offscreen Ursina for the whole run; the software renderer needs no display
+    pytest.importorskip('ursina')
+    from panda3d.core import load_prc_file_data
+    load_prc_file_data('', 'load-display p3tinydisplay\nwindow-type offscreen\naudio-library-name null')
+    from ursina import Ursina
+    return Ursina(window_type='offscreen', size=(320, 240))
+
+
+@pytest.fixture
+def sandbox(tmp_path, monkeypatch):
+    # Drill scenes open the score database, telemetry log, replay writer and map
+    # cache; send all of them to tmp_path instead of the source tree
+    from engine import scores, telemetry
+    from simulation import mapgen, replay
+    monkeypatch.setattr(scores, 'DEFAULT_PATH', str(tmp_path / 'scores.db'))
+    monkeypatch.setattr(scores, 'LEGACY_JSON', str(tmp_path / 'scores.json'))
+    monkeypatch.setattr(telemetry, 'DEFAULT_DIR', str(tmp_path / 'telemetry'))
+    monkeypatch.setattr(replay, 'DEFAULT_DIR', str(tmp_path / 'replays'))
+    monkeypatch.setattr(mapgen, 'disk_cache', False)
+    for module, name in ((scores, '_store'), (telemetry, '_log'), (replay, '_writer')):
+        monkeypatch.setattr(module, name, None)
+    yield tmp_path
+    for writer in (scores._store, telemetry._log, replay._writer):
+        if writer is not None:
+            writer.close()
@@ -0,0 +1,43 @@
+import numpy as np
+
+from simulation import batch, mapgen
+from simulation.flood_grid import FloodGrid, default_terrain
+
+
+def test_depths_at_matches_depth_at():
+    grid = FloodGrid(default_terrain(64, seed=2))
+    grid.step(5.0, 400.0)
+    rng = np.random.default_rng(0)
+    x, z = rng.uniform(-60, 60, (2, 200))  # includes points off the grid
+    assert np.array_equal(grid.depths_at(x, z), [grid.depth_at(a, b) for a, b in zip(x, z)])
+
+
+def test_flood_depth_decides_who_drowns(monkeypatch):
+    monkeypatch.setattr(mapgen, 'disk_cache', False)
+    # Nobody who stands still survives a fast flood; with no water at all everybody does
+    still = {'reaction_delay': 1e9, 'rise_accel': 3.0}
+    assert batch.run('floods', 20, still, seed=1)['outcomes']['failed'] == 20
+    dry = {'rise_base': 0.0, 'rise_accel': 0.0}
+    assert batch.run('floods', 20, dry, seed=1)['outcomes']['success'] == 20
+
+
+def test_debris_hits_players_matches_hit_player():
+    state = batch.earthquake.new_state(3)
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-25, 25, 300), rng.uniform(0.5, 3.0, 300)
+    for _ in range(400):
+        state.debris.step(1 / 60)
+        player, body = state.debris.hits_players(x, y)
+        counts = np.bincount(player, minlength=len(x))
+        fresh = ~state.debris.spent[body]
+        for k in np.flatnonzero(counts)[:5]:
+            expected = np.count_nonzero(fresh[player == k])
+            spent, vel = state.debris.spent.copy(), state.debris.vel.copy()
+            assert state.debris.hit_player(x[k], y[k]) == expected
+            state.debris.spent, state.debris.vel = spent, vel
+
+
+def test_debris_injures_agents(monkeypatch):
+    monkeypatch.setattr(mapgen, 'disk_cache', False)
+    assert batch.run('earthquake', 2000, seed=1)['outcomes']['failed'] > 0
+    assert batch.run('earthquake', 2000, {'hits': 1e9}, seed=1)['outcomes']['failed'] == 0
@@ -0,0 +1,17 @@
+from ursina import color
+
+from engine.batching import StaticBatch
+
+
+def test_textured_props_build(app):
+    batch = StaticBatch()
+    batch.add(model='cube', scale=(100, 0.1, 100), texture='white_cube', texture_scale=(100, 100),
+              color=color.green, collider='box')
+    batch.add(model='cube', position=(40, 1, 0), scale=2, color=color.gray)
+    batch.build()
+    assert batch.built
+    assert batch.count == 2
+    assert len(batch.chunks) == 2
+    assert len(batch.colliders) == 1
+    # The texture survives flattening as a Panda3D texture on the merged geometry
+    assert batch.geometry.find_all_textures().get_num_textures() == 1
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import benchmark
+
+
+def _run(monkeypatch, tmp_path, mean_ms):
+    result = {'frames': 10, 'mean_ms': mean_ms, 'p95_ms': mean_ms, 'max_ms': mean_ms,
+              'startup_s': 1.0, 'peak_rss_mb': 100.0}
+    monkeypatch.setattr(benchmark, 'measure', lambda name, args: dict(result))
+    monkeypatch.setattr(sys, 'argv', ['benchmark.py', 'floods',
+                                      '--report', str(tmp_path / 'report.json'),
+                                      '--baseline', str(tmp_path / 'baseline.json')])
+    return benchmark.main()
+
+
+def test_first_run_becomes_the_baseline(monkeypatch, tmp_path):
+    assert _run(monkeypatch, tmp_path, 10.0) == 0
+    assert os.path.exists(tmp_path / 'baseline.json')
+    assert _run(monkeypatch, tmp_path, 10.5) == 0
+    assert _run(monkeypatch, tmp_path, 20.0) == 1  # compared with the first run, not overwritten
@@ -0,0 +1,14 @@
+import numpy as np
+
+from simulation.debris import DebrisBodies
+
+
+def test_only_hitting_bodies_bounce():
+    # Two pieces at the player's chest: one falling fast, one drifting slowly
+    bodies = DebrisBodies([[0.0, 1.0, 0.0, 0.2, 5.0], [0.1, 1.0, 0.0, 0.2, 0.5]])
+    bodies.awake = np.arange(2)
+    before = bodies.vel.copy()
+    assert bodies.hit_player(0.0, 1.0) == 1
+    assert np.allclose(bodies.vel[0], -bodies.restitution * before[0])
+    assert np.array_equal(bodies.vel[1], before[1])
+    assert bodies.spent.tolist() == [True, False]
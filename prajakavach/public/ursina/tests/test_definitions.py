@@ -0,0 +1,138 @@
+import copy
+
+import pytest
+
+from engine import telemetry
+from simulation import definitions, replay
+from simulation.common import FAILURES
+from simulation.definitions import DefinitionError
+from simulation.scenario import Scenario
+
+
+def check(definition):
+    definitions.check(definition, definitions.load_schema())
+
+
+def effect(definition, kind):
+    return next(e for e in definition['effects'] if e['type'] == kind)
+
+
+def test_failure_names_agree():
+    schema = definitions.load_schema()
+    assert tuple(schema['definitions']['failure']['enum']) == FAILURES
+    assert replay.OUTCOMES == ['success', *FAILURES]
+    assert list(telemetry.OUTCOME_KINDS) == ['success', *FAILURES]
+
+
+def test_every_definition_loads():
+    for definition in definitions.load_all():
+        check(definition)
+
+
+def test_misspelt_hazard_outcome_is_rejected():
+    definition = copy.deepcopy(definitions.get('floods'))
+    definition['hazards'][0]['outcome'] = 'drownd'
+    definition['text']['outcomes']['drownd'] = 'typo'
+    with pytest.raises(DefinitionError, match='drownd'):
+        check(definition)
+    with pytest.raises(DefinitionError, match='drownd'):
+        Scenario(definition)
+
+
+def test_unknown_effect_parameter_is_rejected():
+    definition = copy.deepcopy(definitions.get('heatwave'))
+    definition['effects'][0]['strenght'] = 0.01
+    with pytest.raises(DefinitionError, match='strenght'):
+        check(definition)
+
+
+def test_burst_event_must_be_raised():
+    definition = copy.deepcopy(definitions.get('earthquake'))
+    burst = next(e for e in definition['effects'] if e['type'] == 'burst')
+    burst['event'] = 'hydrated'
+    with pytest.raises(DefinitionError, match='hydrated'):
+        check(definition)
+
+
+@pytest.mark.parametrize('name, kind', [('floods', 'floating_debris'), ('earthquake', 'falling_debris'),
+                                        ('heatwave', 'heat_particles'), ('earthquake', 'burst')])
+def test_effect_without_its_required_parameter_is_rejected(name, kind):
+    definition = copy.deepcopy(definitions.get(name))
+    spec = effect(definition, kind)
+    key = 'event' if kind == 'burst' else 'group'
+    del spec[key]
+    with pytest.raises(DefinitionError, match=f"missing required field '{key}'"):
+        check(definition)
+
+
+def test_parameter_of_another_effect_type_is_rejected():
+    definition = copy.deepcopy(definitions.get('floods'))
+    effect(definition, 'water')['event'] = 'hit'
+    with pytest.raises(DefinitionError, match="unknown field 'event'"):
+        check(definition)
+
+
+def test_unknown_colour_name_is_rejected():
+    definition = copy.deepcopy(definitions.get('floods'))
+    effect(definition, 'floating_debris')['color'] = 'grey'
+    with pytest.raises(DefinitionError, match='grey'):
+        check(definition)
+
+
+def test_colour_names_exist_in_ursina():
+    color = pytest.importorskip('ursina.color')
+    for name in definitions.load_schema()['definitions']['color_name']['enum']:
+        assert isinstance(getattr(color, name), color.Color), name
+
+
+def test_menu_colour_must_be_rgb_values():
+    definition = copy.deepcopy(definitions.get('floods'))
+    definition['menu']['color'] = 'blue'
+    with pytest.raises(DefinitionError, match=r'\$\.menu\.color: expected array'):
+        check(definition)
+
+
+@pytest.mark.parametrize('kind', ['water', 'floating_debris'])
+def test_flood_effect_needs_a_flood_hazard(kind):
+    definition = copy.deepcopy(definitions.get('floods'))
+    definition['hazards'] = [h for h in definition['hazards'] if h['type'] != 'flood']
+    definition['effects'] = [e for e in definition['effects'] if e['type'] in (kind, 'crowd')]
+    with pytest.raises(DefinitionError, match=f'a {kind} effect needs a flood hazard'):
+        check(definition)
+
+
+def test_front_effect_needs_a_front_hazard():
+    definition = copy.deepcopy(definitions.get('landslide'))
+    definition['hazards'] = []
+    with pytest.raises(DefinitionError, match='needs a front hazard'):
+        check(definition)
+
+
+def test_falling_debris_must_draw_the_debris_hazard_group():
+    definition = copy.deepcopy(definitions.get('earthquake'))
+    definition['layout']['rubble'] = dict(definition['layout']['debris'])
+    effect(definition, 'falling_debris')['group'] = 'rubble'
+    with pytest.raises(DefinitionError, match='rubble'):
+        check(definition)
+
+
+def test_non_finite_numbers_are_rejected():
+    definition = copy.deepcopy(definitions.get('floods'))
+    definition['hazards'][0]['rise_base'] = float('nan')
+    with pytest.raises(DefinitionError, match=r'\$\.hazards\[0\]\.rise_base: must be a finite number'):
+        check(definition)
+
+
+def test_reversed_range_is_rejected():
+    definition = copy.deepcopy(definitions.get('floods'))
+    definition['layout']['debris']['x'] = [50, -50]
+    with pytest.raises(DefinitionError, match=r'\$\.layout\.debris\.x: \[50, -50\] must be in increasing order'):
+        check(definition)
+
+
+def test_heat_particles_bottom_above_top_is_rejected():
+    definition = copy.deepcopy(definitions.get('heatwave'))
+    spec = effect(definition, 'heat_particles')
+    spec['bottom'], spec['top'] = 6, 1
+    with pytest.raises(DefinitionError, match='bottom above top'):
+        check(definition)
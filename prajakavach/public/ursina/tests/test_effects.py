@@ -0,0 +1,29 @@
+from direct.showbase import ShowBaseGlobal
+from panda3d.core import ClockObject
+
+from engine import scenes
+from engine.drills import DRILL_SCENES, BurstEffect
+
+
+def test_burst_plays_out_after_the_outcome(app, sandbox, monkeypatch):
+    monkeypatch.setattr(scenes, 'setup_window', lambda *args, **kwargs: None)
+    clock = ClockObject.get_global_clock()
+    clock.set_mode(ClockObject.M_forced)
+    clock.set_frame_rate(60)
+    try:
+        manager = scenes.SceneManager({'earthquake': DRILL_SCENES['earthquake']}, home='earthquake')
+        scene = manager.current
+        step = ShowBaseGlobal.base.taskMgr.step
+        step()
+        burst = next(e for e in scene.effects if isinstance(e, BurstEffect))
+        # A hit on the same step that ends the attempt
+        scene.state.events.append('hit')
+        scene.state.outcome = 'injured'
+        burst.update(scene.state)
+        scene.state.events.clear()
+        assert len(burst.pool) == burst.count
+        for _ in range(60):
+            step()
+        assert len(burst.pool) == 0
+    finally:
+        clock.set_mode(ClockObject.M_normal)
@@ -0,0 +1,24 @@
+import os
+
+from simulation import mapgen
+
+
+def test_disk_cache_keeps_most_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(mapgen, 'DISK_ENTRIES', 3)
+    monkeypatch.setattr(mapgen, '_memory', mapgen.OrderedDict())
+    cache = str(tmp_path)
+
+    def age():
+        # Give the files distinct mtimes in their current order, oldest first
+        paths = sorted(tmp_path.iterdir(), key=os.path.getmtime)
+        for i, path in enumerate(paths):
+            os.utime(path, (i, i))
+
+    for seed in (1, 2, 3):
+        mapgen.generate('floods', seed, cache_dir=cache)
+        age()
+    mapgen._memory.clear()
+    assert mapgen.generate('floods', 1, cache_dir=cache).from_cache  # seed 1 is now the most recent
+    mapgen.generate('floods', 4, cache_dir=cache)
+    seeds = sorted(int(path.name.split('-')[1]) for path in tmp_path.iterdir())
+    assert seeds == [1, 3, 4]
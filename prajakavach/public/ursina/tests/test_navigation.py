@@ -0,0 +1,46 @@
+import numpy as np
+
+from simulation import crowd, definitions
+from simulation.navigation import FlowField, NavGrid
+
+
+def _field():
+    grid = NavGrid(extent=20.0, cell=0.5)
+    grid.add_box(0.0, 0.0, 1.0, 4.0)
+    return FlowField(grid, [(8.0, 0.0, 1.0)])
+
+
+def _same(field, fresh):
+    assert np.array_equal(field.distance, fresh.distance)
+    assert np.allclose(field.directions, fresh.directions, atol=1e-6)
+
+
+def test_replan_matches_a_fresh_bake():
+    field = _field()
+    # Water closing a band of cells, then part of it clearing again
+    field.grid.flooded[10:30, 24:27] = True
+    field.refresh()
+    _same(field, FlowField(field.grid.copy(), field.goals))
+    field.grid.flooded[10:20, 24:27] = False
+    field.refresh()
+    _same(field, FlowField(field.grid.copy(), field.goals))
+
+
+def test_budgeted_replan_settles_to_the_same_field():
+    field = _field()
+    field.grid.flooded[0:36, 30:32] = True
+    field.refresh(budget=2)
+    assert not field.settle(budget=0)
+    while not field.settle(budget=2):
+        pass
+    _same(field, FlowField(field.grid.copy(), field.goals))
+
+
+def test_restart_reuses_the_baked_field():
+    definition = definitions.get('earthquake')
+    first = crowd.from_definition(definition, seed=3).field
+    again = crowd.from_definition(definition, seed=3).field
+    assert again.distance is not first.distance and np.array_equal(again.distance, first.distance)
+    first.grid.flooded[:] = True
+    first.refresh()
+    assert not again.grid.flooded.any() and np.isfinite(again.distance).any()
@@ -0,0 +1,16 @@
+from simulation import replay
+from simulation.common import Inputs
+
+
+def test_writer_saves_in_the_background(tmp_path, monkeypatch):
+    monkeypatch.setattr(replay, 'DEFAULT_DIR', str(tmp_path / 'replays'))
+    recording = replay.Recording('floods', 7)
+    for step in range(100):
+        recording.record(Inputs(False, False, False, step % 3 == 0))
+    writer = replay.ReplayWriter()
+    path = writer.save(recording, tag=0x1234)
+    writer.flush()
+    loaded = replay.Recording.load(path)
+    assert loaded.runs == recording.runs and loaded.seed == 7
+    writer.close()
+    assert not writer.thread.is_alive()
@@ -0,0 +1,31 @@
+from direct.showbase import ShowBaseGlobal
+from panda3d.core import ClockObject
+
+from engine import profiler, scenes
+from engine.drills import DRILL_SCENES
+
+
+def test_switch_time_goes_to_the_profiler(app, sandbox, monkeypatch):
+    monkeypatch.setattr(scenes, 'setup_window', lambda *args, **kwargs: None)
+    monkeypatch.setattr(profiler, '_profiler', profiler.Profiler())
+    manager = scenes.SceneManager({'menu': scenes.Scene, 'drill': scenes.Scene}, home='menu')
+    manager.show('drill')
+    assert profiler.get().notes['switch'] == manager.last_switch_ms
+
+
+def test_recording_stops_at_the_outcome(app, sandbox, monkeypatch):
+    monkeypatch.setattr(scenes, 'setup_window', lambda *args, **kwargs: None)
+    clock = ClockObject.get_global_clock()
+    clock.set_mode(ClockObject.M_forced)
+    clock.set_frame_rate(6)  # ten fixed steps per frame
+    try:
+        manager = scenes.SceneManager({'earthquake': DRILL_SCENES['earthquake']}, home='earthquake')
+        scene = manager.current
+        step = ShowBaseGlobal.base.taskMgr.step
+        step()
+        scene.state.remaining = 0.05  # runs out three steps into the next frame
+        step()
+        assert scene.state.outcome == 'timeout'
+        assert scene.recording.steps == round(scene.state.elapsed / scene.clock.dt)
+    finally:
+        clock.set_mode(ClockObject.M_normal)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from engine.geometry import vertex_view
+from engine.water import WaterSurface
+from simulation.flood_grid import FloodGrid
+
+
+def test_only_changed_rows_are_written(app):
+    flood = FloodGrid(np.zeros((64, 64), dtype=np.float32), extent=64.0)
+    flood.depth[:] = 0.5
+    surface = WaterSurface(flood, stride=2)
+    height = surface.shape[0]
+    assert surface.rows_written == height
+    # Rain on scattered rows far apart: the rows between them are left alone
+    flood.depth[[2, 30, 60], :] += 0.1
+    surface.sync()
+    assert surface.rows_written == 3 < height
+    surface.sync()
+    assert surface.rows_written == 0
+    verts = vertex_view(surface.geom_node).reshape(surface.shape + (3,))
+    assert np.allclose(verts[[1, 15, 30], :, 1], 0.6)
+    assert np.allclose(verts[[0, 2, 29], :, 1], 0.5)